@@ -0,0 +1,205 @@
+import math
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from transcript import Course, Department, GradeChange, Student, StudentObserver
+
+
+class RunningStats:
+    __slots__ = ('n', 'mean', 'm2')
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.n -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.n
+        self.m2 -= delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return max(self.m2, 0.0) / self.n if self.n else 0.0
+
+
+class CourseAggregate:
+    __slots__ = ('counts', 'stats')
+
+    def __init__(self, grades: int):
+        self.counts = [0] * grades
+        self.stats = RunningStats()
+
+
+class AggregateSnapshot(NamedTuple):
+    course_counts: Dict[int, List[int]]
+    course_mean: Dict[int, float]
+    course_variance: Dict[int, float]
+    department_mean: Dict[int, float]
+    department_variance: Dict[int, float]
+
+
+class GradeAggregates(StudentObserver):
+    def __init__(self):
+        self.grades = Student.GRADES
+        self.points = [Student.GRADE_POINTS[grade] for grade in self.grades]
+        self.grade_codes = {grade: code for code, grade in enumerate(self.grades)}
+        self.courses: Dict[int, CourseAggregate] = {
+            numeric_course_code: CourseAggregate(len(self.grades)) for numeric_course_code in Course.course_details
+        }
+        self.departments: Dict[int, RunningStats] = {dept_id: RunningStats() for dept_id in Department.department_details}
+        self._student_cgpa: Dict[int, Tuple[int, float]] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def build(cls, students: Optional[Iterable[Student]] = None, attach: bool = True) -> 'GradeAggregates':
+        aggregates = cls()
+        if students is None:
+            students = Student.student_details.values()
+        for student in students:
+            for semester, courses in student.courses_taken.items():
+                for numeric_course_code, grade in courses:
+                    aggregates._record(numeric_course_code, None, grade)
+            aggregates._update_department(student)
+        if attach:
+            aggregates.attach()
+        return aggregates
+
+    def _course(self, numeric_course_code: int) -> CourseAggregate:
+        course = self.courses.get(numeric_course_code)
+        if course is None:
+            course = self.courses[numeric_course_code] = CourseAggregate(len(self.grades))
+        return course
+
+    def _record(self, numeric_course_code: int, old_grade: Optional[str], new_grade: Optional[str]) -> None:
+        course = self._course(numeric_course_code)
+        if old_grade is not None:
+            code = self.grade_codes[old_grade]
+            course.counts[code] -= 1
+            course.stats.remove(self.points[code])
+        if new_grade is not None:
+            code = self.grade_codes[new_grade]
+            course.counts[code] += 1
+            course.stats.add(self.points[code])
+
+    def _update_department(self, student: Student) -> None:
+        previous = self._student_cgpa.pop(student.id, None)
+        if previous is not None:
+            self.departments[previous[0]].remove(previous[1])
+        if student.total_credit_hour_taken > 0:
+            stats = self.departments.get(student.dept_id)
+            if stats is None:
+                stats = self.departments[student.dept_id] = RunningStats()
+            stats.add(student.cgpa)
+            self._student_cgpa[student.id] = (student.dept_id, student.cgpa)
+
+    def student_updated(self, student: Student, changes: List[GradeChange], old_cgpa: float) -> None:
+        with self._lock:
+            for _, numeric_course_code, old_grade, new_grade in changes:
+                self._record(numeric_course_code, old_grade, new_grade)
+            self._update_department(student)
+
+    def course_histogram(self, numeric_course_code: int) -> Dict[str, int]:
+        with self._lock:
+            course = self.courses.get(numeric_course_code)
+            counts = course.counts if course else [0] * len(self.grades)
+            return dict(zip(self.grades, counts))
+
+    def course_mean(self, numeric_course_code: int) -> Optional[float]:
+        with self._lock:
+            course = self.courses.get(numeric_course_code)
+            return course.stats.mean if course and course.stats.n else None
+
+    def course_variance(self, numeric_course_code: int) -> Optional[float]:
+        with self._lock:
+            course = self.courses.get(numeric_course_code)
+            return course.stats.variance if course and course.stats.n else None
+
+    def department_mean_cgpa(self, dept_id: int) -> Optional[float]:
+        with self._lock:
+            stats = self.departments.get(dept_id)
+            return stats.mean if stats and stats.n else None
+
+    def department_cgpa_variance(self, dept_id: int) -> Optional[float]:
+        with self._lock:
+            stats = self.departments.get(dept_id)
+            return stats.variance if stats and stats.n else None
+
+    def snapshot(self) -> AggregateSnapshot:
+        with self._lock:
+            courses = {code: course for code, course in self.courses.items() if course.stats.n}
+            departments = {dept_id: stats for dept_id, stats in self.departments.items() if stats.n}
+            return AggregateSnapshot(
+                course_counts={code: list(course.counts) for code, course in courses.items()},
+                course_mean={code: course.stats.mean for code, course in courses.items()},
+                course_variance={code: course.stats.variance for code, course in courses.items()},
+                department_mean={dept_id: stats.mean for dept_id, stats in departments.items()},
+                department_variance={dept_id: stats.variance for dept_id, stats in departments.items()},
+            )
+
+    def verify(self, students: Optional[Iterable[Student]] = None, tolerance: float = 1e-9) -> List[str]:
+        expected = rebuild(students)
+        actual = self.snapshot()
+        problems = []
+        for field in AggregateSnapshot._fields:
+            want, have = getattr(expected, field), getattr(actual, field)
+            if set(want) != set(have):
+                problems.append(f"{field}: keys differ ({sorted(set(want) ^ set(have))[:10]})")
+                continue
+            for key, value in want.items():
+                if isinstance(value, list):
+                    if value != have[key]:
+                        problems.append(f"{field}[{key}]: expected {value}, found {have[key]}")
+                elif not math.isclose(value, have[key], rel_tol=tolerance, abs_tol=tolerance):
+                    problems.append(f"{field}[{key}]: expected {value}, found {have[key]}")
+        return problems
+
+
+def rebuild(students: Optional[Iterable[Student]] = None) -> AggregateSnapshot:
+    if students is None:
+        students = Student.student_details.values()
+    students = list(students)
+    grades = len(Student.GRADES)
+    points = np.array(Student._GRADE_POINT_TABLE, dtype=np.float64)
+
+    course_codes = np.concatenate(
+        [np.frombuffer(student._course_codes, dtype=np.uint32) for student in students] or [np.empty(0, np.uint32)]
+    )
+    grade_codes = np.concatenate(
+        [np.frombuffer(student._grade_codes, dtype=np.uint8) for student in students] or [np.empty(0, np.uint8)]
+    )
+    codes, course_idx = np.unique(course_codes, return_inverse=True)
+    counts = np.bincount(course_idx * grades + grade_codes, minlength=len(codes) * grades).reshape(len(codes), grades)
+    grade_points = points[grade_codes]
+    n = counts.sum(axis=1)
+    mean = np.bincount(course_idx, weights=grade_points, minlength=len(codes)) / n
+    variance = np.bincount(course_idx, weights=(grade_points - mean[course_idx]) ** 2, minlength=len(codes)) / n
+
+    graded = [student for student in students if student.total_credit_hour_taken > 0]
+    dept_ids, dept_idx = np.unique(np.array([s.dept_id for s in graded], dtype=np.int64), return_inverse=True)
+    cgpa = np.array([s.cgpa for s in graded], dtype=np.float64)
+    dept_n = np.bincount(dept_idx, minlength=len(dept_ids))
+    dept_mean = np.bincount(dept_idx, weights=cgpa, minlength=len(dept_ids)) / dept_n
+    dept_variance = np.bincount(dept_idx, weights=(cgpa - dept_mean[dept_idx]) ** 2, minlength=len(dept_ids)) / dept_n
+
+    course_keys = codes.tolist()
+    dept_keys = dept_ids.tolist()
+    return AggregateSnapshot(
+        course_counts=dict(zip(course_keys, counts.tolist())),
+        course_mean=dict(zip(course_keys, mean.tolist())),
+        course_variance=dict(zip(course_keys, variance.tolist())),
+        department_mean=dict(zip(dept_keys, dept_mean.tolist())),
+        department_variance=dict(zip(dept_keys, dept_variance.tolist())),
+    )
@@ -0,0 +1,101 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Deque, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from transcript import Course, Curriculum, Department, Student
+from writer import Layout, TextLayout, TranscriptWriter, get_layout
+
+StudentRecord = Tuple[int, str, str, int, Dict[str, Tuple[Tuple[int, str], ...]]]
+
+
+_text_layout = TextLayout()
+_worker_layout: Layout = _text_layout
+
+
+def render_transcript(student: Student) -> str:
+    return _text_layout.render(student)
+
+
+def _student_record(student: Student) -> StudentRecord:
+    return student.id, student.firstname, student.lastname, student.dept_id, dict(student.courses_taken)
+
+
+def _init_worker(courses: Dict[int, Course], curriculum: Dict[int, Curriculum],
+                 departments: Dict[int, Department], layout: str = 'text') -> None:
+    global _worker_layout
+    _worker_layout = get_layout(layout)
+    Course.course_details = courses
+    Curriculum.Curriculum_details = curriculum
+    Curriculum.catalog()
+    Department.department_details = departments
+
+
+def _render_records(records: List[StudentRecord]) -> str:
+    parts = []
+    for student_id, firstname, lastname, dept_id, courses_taken in records:
+        student = Student(student_id, firstname, lastname, dept_id)
+        student.load_course_list()
+        student.courses_taken = courses_taken
+        parts.append(_worker_layout.render(student))
+    return "".join(parts)
+
+
+def partition_students(students: Iterable[Student], chunk_size: int = 500,
+                       key: Callable[[Student], Hashable] = lambda student: student.dept_id
+                       ) -> Iterator[Tuple[Hashable, List[StudentRecord]]]:
+    pending: Dict[Hashable, List[StudentRecord]] = {}
+    for student in students:
+        group = key(student)
+        records = pending.setdefault(group, [])
+        records.append(_student_record(student))
+        if len(records) >= chunk_size:
+            yield group, records
+            pending[group] = []
+    for group, records in pending.items():
+        if records:
+            yield group, records
+
+
+def generate_transcripts(output_dir: str, students: Optional[Iterable[Student]] = None,
+                         max_workers: Optional[int] = None, chunk_size: int = 500,
+                         max_in_flight: Optional[int] = None,
+                         key: Callable[[Student], Hashable] = lambda student: student.dept_id,
+                         layout: str = 'text', compress: bool = False) -> Dict[Hashable, int]:
+    if students is None:
+        students = Student.student_details.values()
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = max_workers * 2
+
+    os.makedirs(output_dir, exist_ok=True)
+    extension = get_layout(layout).extension + ('.gz' if compress else '')
+    outputs: Dict[Hashable, TranscriptWriter] = {}
+    written: Dict[Hashable, int] = {}
+    in_flight: Deque[Tuple[Hashable, int, Future]] = deque()
+
+    def drain_one() -> None:
+        group, count, future = in_flight.popleft()
+        output = outputs.get(group)
+        if output is None:
+            output = outputs[group] = TranscriptWriter(os.path.join(output_dir, f"transcripts_{group}.{extension}"),
+                                                       layout, compress)
+        output.write_rendered(future.result(), count)
+        written[group] = written.get(group, 0) + count
+
+    initargs = (dict(Course.course_details), dict(Curriculum.Curriculum_details),
+                dict(Department.department_details), layout)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=initargs) as executor:
+            for group, records in partition_students(students, chunk_size, key):
+                if len(in_flight) >= max_in_flight:
+                    drain_one()
+                in_flight.append((group, len(records), executor.submit(_render_records, records)))
+            while in_flight:
+                drain_one()
+    finally:
+        for output in outputs.values():
+            output.close()
+    return written
@@ -0,0 +1,64 @@
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcript import Student
+
+
+def write_students(path: str, rows: int) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["id", "firstname", "lastname", "dept_id"])
+        for student_id in range(rows):
+            writer.writerow([student_id, f"First{student_id}", f"Last{student_id}", 300 + student_id % 90])
+
+
+def dictreader_load(path: str) -> dict:
+    students = {}
+    with open(path, newline="", encoding="utf-8") as csvfile:
+        for row in csv.DictReader(csvfile):
+            try:
+                student = Student(int(row["id"]), row["firstname"], row["lastname"], int(row["dept_id"]))
+                students[student.id] = student
+            except (KeyError, ValueError) as e:
+                print(f"Error processing row {row}: {e}")
+    return students
+
+
+def schema_load(path: str) -> dict:
+    Student.student_details = {}
+    return Student.from_csv(path)
+
+
+def best_of(func, path: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare DictReader and schema-compiled student loading")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "students.csv")
+        write_students(path, args.rows)
+        timings = {}
+        for name, func in (("dictreader", dictreader_load), ("schema", schema_load)):
+            seconds = timings[name] = best_of(func, path, args.repeat)
+            print(f"{name:<12} {seconds:8.3f}s  {args.rows / seconds:12,.0f} rows/s")
+        print(f"speedup      {timings['dictreader'] / timings['schema']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcript import Curriculum, Student
+
+SEMESTERS = [f"{term} {year}" for year in range(2020, 2025) for term in ("Spring", "Fall")]
+GRADES = list(Student.GRADE_POINTS)
+
+
+def build_students(count: int, courses_per_student: int) -> list:
+    Student.enforce_prerequisites = False
+    codes = list(Curriculum.catalog())
+    students = []
+    for student_id in range(count):
+        student = Student(student_id, f"First{student_id}", f"Last{student_id}", 389)
+        student.load_course_list()
+        for n in range(courses_per_student):
+            student.add_course(SEMESTERS[n * len(SEMESTERS) // courses_per_student],
+                               codes[(student_id + n) % len(codes)], GRADES[(student_id * 7 + n) % len(GRADES)])
+        students.append(student)
+    return students
+
+
+class LegacyStudent:
+    def __init__(self, id: int, firstname: str, lastname: str, dept_id: int):
+        self.id = id
+        self.firstname = firstname
+        self.lastname = lastname
+        self.dept_id = dept_id
+        self.course_curriculum: Dict[int, Curriculum] = {}
+        self.courses_taken: Dict[str, List[Tuple[int, str]]] = {}
+        self.total_credit_hour_taken: int = 0
+        self.cgpa: float = 0.0
+
+    def load_course_list(self) -> None:
+        self.course_curriculum = dict(Curriculum.Curriculum_details)
+
+    def add_course(self, semester: str, code: int, grade: str) -> None:
+        self.courses_taken.setdefault(semester, []).append((code, grade))
+        self.total_credit_hour_taken += self.course_curriculum[code].credit
+
+
+def build_legacy_students(count: int, courses_per_student: int) -> list:
+    codes = list(Curriculum.catalog())
+    students = []
+    for student_id in range(count):
+        student = LegacyStudent(student_id, f"First{student_id}", f"Last{student_id}", 389)
+        student.load_course_list()
+        for n in range(courses_per_student):
+            student.add_course(SEMESTERS[n * len(SEMESTERS) // courses_per_student],
+                               codes[(student_id + n) % len(codes)], GRADES[(student_id * 7 + n) % len(GRADES)])
+        students.append(student)
+    return students
+
+
+def measure(build, count: int, courses_per_student: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    students = build(count, courses_per_student)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(students)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure resident bytes per Student")
+    parser.add_argument("--students", type=int, default=20000)
+    parser.add_argument("--courses", type=int, default=40)
+    args = parser.parse_args()
+
+    Curriculum.Curriculum_details = {
+        code: Curriculum(code, 3 + code % 3, 3, 0, 5.0, []) for code in range(3500000, 3500000 + 200)
+    }
+    Curriculum.catalog()
+
+    legacy = measure(build_legacy_students, args.students, args.courses)
+    current = measure(build_students, args.students, args.courses)
+    print(f"{args.students} students x {args.courses} courses:")
+    print(f"  dict/list layout: {legacy:,.0f} bytes per student")
+    print(f"  compact layout:   {current:,.0f} bytes per student ({legacy / current:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from store import SQLiteStore
+from synthetic import generate
+from transcript import Course, Curriculum, Department, Student
+
+
+def timed(results: dict, name: str, func, *args):
+    start = time.perf_counter()
+    value = func(*args)
+    results[name] = round(time.perf_counter() - start, 4)
+    return value
+
+
+def in_memory(paths: dict) -> dict:
+    results: dict = {}
+    Department.department_details, Course.course_details, Student.student_details = {}, {}, {}
+    timed(results, "load_catalogs", lambda: (Department.from_csv(paths["departments"]),
+                                             Course.from_csv(paths["courses"]),
+                                             Curriculum.from_csv(paths["curriculum"])))
+
+    def load_students():
+        for student in Student.from_csv(paths["students"]).values():
+            student.load_course_list()
+
+    timed(results, "load_students", load_students)
+    timed(results, "load_grades", Student.grades_from_csv, paths["grades"])
+    timed(results, "cohort_cgpa", lambda: {s.id: s.calculate_cgpa() for s in Student.student_details.values()})
+    Student.student_details = {}
+    return results
+
+
+def sqlite(paths: dict, directory: str) -> dict:
+    results: dict = {}
+    with SQLiteStore(os.path.join(directory, "registry.db")) as store:
+        timed(results, "load_catalogs", lambda: (store.load_departments(paths["departments"]),
+                                                 store.load_courses(paths["courses"]),
+                                                 store.load_curriculum(paths["curriculum"])))
+        timed(results, "load_students", store.load_students, paths["students"])
+        timed(results, "load_grades", store.load_grades, paths["grades"])
+        timed(results, "cohort_cgpa", store.cohort_totals)
+        timed(results, "single_student_cgpa", store.cgpa, 2000000)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the in-memory registries with the SQLite store")
+    parser.add_argument("--scales", type=int, nargs="+", default=[10000, 100000, 1000000])
+    args = parser.parse_args()
+
+    for students in args.scales:
+        with tempfile.TemporaryDirectory() as directory:
+            paths = generate(directory, students)
+            print(json.dumps({"students": students, "memory": in_memory(paths),
+                              "sqlite": sqlite(paths, directory)}))
+
+
+if __name__ == "__main__":
+    main()
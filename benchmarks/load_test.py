@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from service import TranscriptCache, TranscriptService
+from synthetic import generate
+from transcript import Course, Curriculum, Department, Student
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+async def client(host: str, port: int, paths: List[str], latencies: List[float]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for path in paths:
+            start = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+            await writer.drain()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def run(host: str, port: int, student_ids: List[int], requests: int, concurrency: int,
+              seed: int) -> dict:
+    rng = random.Random(seed)
+    paths = [f"/students/{rng.choice(student_ids)}/{rng.choice(('transcript', 'gpa'))}" for _ in range(requests)]
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, paths[i::concurrency], latencies) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 4),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+async def self_hosted(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = generate(directory, args.students)
+        Department.from_csv(paths["departments"])
+        Course.from_csv(paths["courses"])
+        Curriculum.from_csv(paths["curriculum"])
+        for student in Student.from_csv(paths["students"]).values():
+            student.load_course_list()
+        Student.grades_from_csv(paths["grades"])
+
+    service = TranscriptService(TranscriptCache(args.cache_bytes))
+    server = await service.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        result = await run("127.0.0.1", port, list(Student.student_details), args.requests, args.concurrency,
+                           args.seed)
+    finally:
+        await service.close()
+    result.update(cache_hits=service.cache.hits, cache_misses=service.cache.misses)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure transcript service latency")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="target a running service instead of starting one")
+    parser.add_argument("--student-ids", type=int, nargs="+", default=[])
+    parser.add_argument("--students", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--cache-bytes", type=int, default=64 << 20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.port is None:
+        result = asyncio.run(self_hosted(args))
+    else:
+        if not args.student_ids:
+            parser.error("--student-ids is required with --port")
+        result = asyncio.run(run(args.host, args.port, args.student_ids, args.requests, args.concurrency,
+                                 args.seed))
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
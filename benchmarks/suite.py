@@ -0,0 +1,216 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from batch import generate_transcripts, render_transcript
+from synthetic import generate
+from transcript import Course, Curriculum, Department, Student
+from writer import LAYOUTS, write_transcripts
+
+SUFFIXES = {'k': 1000, 'm': 1000000}
+
+
+def parse_scale(value: str) -> int:
+    suffix = value[-1:].lower()
+    if suffix in SUFFIXES:
+        return int(float(value[:-1]) * SUFFIXES[suffix])
+    return int(value)
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def reset_registries() -> None:
+    Department.department_details, Course.course_details, Student.student_details = {}, {}, {}
+    Curriculum.Curriculum_details = {}
+    Student.observers = []
+
+
+def load_students(path: str) -> Dict[int, Student]:
+    students = Student.from_csv(path)
+    for student in students.values():
+        student.load_course_list()
+    return students
+
+
+class Suite:
+    def __init__(self, paths: Dict[str, str], repeat: int, workers: Optional[int]):
+        self.paths = paths
+        self.repeat = repeat
+        self.workers = workers
+        self.results: Dict[str, dict] = {}
+
+    def measure(self, name: str, func: Callable[[], object], setup: Optional[Callable[[], None]] = None,
+                items: Optional[int] = None) -> None:
+        timings: List[float] = []
+        for _ in range(self.repeat):
+            if setup is not None:
+                setup()
+            gc.collect()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        result = {'seconds': round(best, 4), 'runs': [round(t, 4) for t in timings]}
+        if items:
+            result['items'] = items
+            result['per_second'] = round(items / best, 1) if best else None
+        self.results[name] = result
+
+    def loaders(self) -> None:
+        paths = self.paths
+        self.measure('department_from_csv', lambda: Department.from_csv(paths['departments']),
+                     setup=lambda: setattr(Department, 'department_details', {}))
+        self.measure('course_from_csv', lambda: Course.from_csv(paths['courses']),
+                     setup=lambda: setattr(Course, 'course_details', {}))
+        self.measure('curriculum_from_csv', lambda: Curriculum.from_csv(paths['curriculum']))
+        self.measure('student_from_csv', lambda: load_students(paths['students']),
+                     setup=lambda: setattr(Student, 'student_details', {}))
+        self.measure('grades_from_csv', lambda: Student.grades_from_csv(paths['grades']),
+                     setup=lambda: load_students(paths['students']))
+
+    def bulk_add_course(self) -> None:
+        records = [record for chunk in Student.iter_grade_records(self.paths['grades']) for record in chunk]
+        enrolled = Student.student_details
+
+        def run() -> None:
+            students = Student.student_details
+            for _, student_id, semester, numeric_course_code, grade in records:
+                students[student_id].add_course(semester, numeric_course_code, grade)
+
+        self.measure('add_course', run, setup=lambda: load_students(self.paths['students']), items=len(records))
+        Student.student_details = enrolled
+
+    def gpa(self) -> None:
+        students = list(Student.student_details.values())
+        semesters = [(student, student.semester_order()) for student in students]
+        semester_count = sum(len(order) for _, order in semesters)
+
+        def cgpa() -> None:
+            for student in students:
+                student.calculate_cgpa()
+
+        def semester_gpa() -> None:
+            for student, order in semesters:
+                for semester in order:
+                    student.calculate_semester_gpa(semester)
+
+        def recalculate() -> None:
+            for student in students:
+                student.recalculate_totals()
+
+        self.measure('calculate_cgpa', cgpa, items=len(students))
+        self.measure('calculate_semester_gpa', semester_gpa, items=semester_count)
+        self.measure('recalculate_totals', recalculate, items=len(students))
+
+    def transcripts(self, output_dir: str) -> None:
+        students = list(Student.student_details.values())
+
+        def render() -> None:
+            for student in students:
+                render_transcript(student)
+
+        self.measure('render_transcript', render, items=len(students))
+        self.measure('generate_transcripts', lambda: generate_transcripts(output_dir, students, self.workers),
+                     items=len(students))
+        os.makedirs(output_dir, exist_ok=True)
+        for layout in LAYOUTS:
+            for suffix in ('', '.gz'):
+                path = os.path.join(output_dir, f'all.{layout}{suffix}')
+                self.measure(f'write_{layout}{suffix.replace(".", "_")}',
+                             lambda path=path, layout=layout: write_transcripts(path, students, layout),
+                             items=len(students))
+
+    def run(self, output_dir: str) -> Dict[str, dict]:
+        reset_registries()
+        self.loaders()
+        self.bulk_add_course()
+        self.gpa()
+        self.transcripts(output_dir)
+        reset_registries()
+        return self.results
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_seconds: float) -> List[dict]:
+    regressions = []
+    for name, result in current['scenarios'].items():
+        previous = baseline['scenarios'].get(name)
+        if not previous or max(previous['seconds'], result['seconds']) < min_seconds:
+            continue
+        ratio = result['seconds'] / previous['seconds']
+        if ratio > 1 + threshold:
+            regressions.append({'scenario': name, 'students': current['students'], 'baseline': previous['seconds'],
+                                'current': result['seconds'], 'ratio': round(ratio, 3)})
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the loaders, GPA queries and transcript generation "
+                                                 "on deterministic synthetic data")
+    parser.add_argument('--scales', nargs='+', default=['1k', '100k'],
+                        help="student counts, e.g. 1k 100k 1M")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--output', help="write the results as JSON lines to this file")
+    parser.add_argument('--baseline', help="JSON lines from an earlier run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="relative slowdown reported as a regression")
+    parser.add_argument('--min-seconds', type=float, default=0.05,
+                        help="ignore scenarios faster than this in both runs when comparing")
+    args = parser.parse_args()
+
+    baselines = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as source:
+            for line in source:
+                if line.strip():
+                    entry = json.loads(line)
+                    baselines[entry['students']] = entry
+
+    environment = {'revision': git_revision(), 'python': platform.python_version(),
+                   'machine': platform.machine(), 'cpus': os.cpu_count()}
+    output = open(args.output, 'w', encoding='utf-8') if args.output else None
+    regressions: List[dict] = []
+    try:
+        for scale in map(parse_scale, args.scales):
+            with tempfile.TemporaryDirectory() as directory:
+                start = time.perf_counter()
+                paths = generate(directory, scale, seed=args.seed)
+                generated = round(time.perf_counter() - start, 4)
+                scenarios = Suite(paths, args.repeat, args.workers).run(os.path.join(directory, 'transcripts'))
+            entry = dict(environment, students=scale, seed=args.seed, repeat=args.repeat,
+                         generate_seconds=generated, scenarios=scenarios)
+            line = json.dumps(entry)
+            print(line)
+            if output is not None:
+                output.write(line + '\n')
+            if scale in baselines:
+                regressions.extend(compare(baselines[scale], entry, args.threshold, args.min_seconds))
+    finally:
+        if output is not None:
+            output.close()
+
+    if args.baseline:
+        print(json.dumps({'regressions': regressions}))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
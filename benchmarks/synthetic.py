@@ -0,0 +1,79 @@
+import argparse
+import csv
+import json
+import os
+import random
+from typing import Dict, List
+
+GRADES = ['A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'D+', 'D', 'F']
+
+
+def semester_label(level: int) -> str:
+    return f"Fall {2020 + level // 2}" if level % 2 == 0 else f"Spring {2021 + level // 2}"
+
+
+def course_code(track: int, level: int) -> int:
+    return 3000000 + track * 100 + level
+
+
+def generate(directory: str, students: int, departments: int = 10, tracks: int = 25, levels: int = 8,
+             tracks_per_student: int = 5, seed: int = 0) -> Dict[str, str]:
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    paths = {name: os.path.join(directory, f"{name}.csv")
+             for name in ("departments", "courses", "curriculum", "students", "grades")}
+    dept_ids = [300 + n for n in range(departments)]
+
+    with open(paths["departments"], "w", newline="", encoding="utf-8") as output:
+        writer = csv.writer(output)
+        writer.writerow(["dept_id", "dept_name"])
+        writer.writerows((dept_id, f"Department {dept_id}") for dept_id in dept_ids)
+
+    with open(paths["courses"], "w", newline="", encoding="utf-8") as courses, \
+            open(paths["curriculum"], "w", newline="", encoding="utf-8") as curriculum:
+        course_writer = csv.writer(courses)
+        curriculum_writer = csv.writer(curriculum)
+        course_writer.writerow(["numeric_course_code", "course_code", "course_name"])
+        curriculum_writer.writerow(["numeric_course_code", "credit", "theory", "practical", "ects", "prerequisite"])
+        for track in range(tracks):
+            for level in range(levels):
+                code = course_code(track, level)
+                credit = rng.choice((0, 2, 3, 3, 4, 4, 5))
+                course_writer.writerow([code, f"T{track:02d}{level}", f"Track {track} Level {level}"])
+                prerequisite = str(course_code(track, level - 1)) if level else "Null"
+                curriculum_writer.writerow([code, credit, credit, rng.choice((0, 2)), credit * 1.5, prerequisite])
+
+    with open(paths["students"], "w", newline="", encoding="utf-8") as roster, \
+            open(paths["grades"], "w", newline="", encoding="utf-8") as grades:
+        roster_writer = csv.writer(roster)
+        grade_writer = csv.writer(grades)
+        roster_writer.writerow(["id", "firstname", "lastname", "dept_id"])
+        grade_writer.writerow(["student_id", "semester", "numeric_course_code", "grade"])
+        for n in range(students):
+            student_id = 2000000 + n
+            roster_writer.writerow([student_id, f"First{n}", f"Last{n}", rng.choice(dept_ids)])
+            chosen: List[int] = rng.sample(range(tracks), min(tracks_per_student, tracks))
+            for level in range(levels):
+                label = semester_label(level)
+                for track in chosen:
+                    grade = rng.choice(GRADES if level == levels - 1 else GRADES[:-1])
+                    grade_writer.writerow([student_id, label, course_code(track, level), grade])
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a deterministic synthetic registry")
+    parser.add_argument("directory")
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--departments", type=int, default=10)
+    parser.add_argument("--tracks", type=int, default=25)
+    parser.add_argument("--levels", type=int, default=8)
+    parser.add_argument("--tracks-per-student", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(json.dumps(generate(args.directory, args.students, args.departments, args.tracks, args.levels,
+                              args.tracks_per_student, args.seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+from typing import Iterable, List, Mapping, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from transcript import Curriculum, Student
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+class CohortTotals(NamedTuple):
+    student_ids: np.ndarray
+    dept_ids: np.ndarray
+    quality_points: np.ndarray
+    credits: np.ndarray
+    remaining_credits: np.ndarray
+
+
+class Projection(NamedTuple):
+    required_average: np.ndarray
+    feasible: np.ndarray
+    already_met: np.ndarray
+
+
+def cohort_totals(students: Optional[Iterable[Student]] = None,
+                  required_courses: Optional[Mapping[int, Iterable[int]]] = None) -> CohortTotals:
+    if students is None:
+        students = Student.student_details.values()
+    students = list(students)
+    curriculum = Curriculum.catalog()
+    course_codes = np.array(sorted(curriculum), dtype=np.uint32)
+    credits = np.array([curriculum[code].credit for code in course_codes.tolist()], dtype=np.int64)
+
+    dept_ids = np.array([student.dept_id for student in students], dtype=np.int64)
+    departments, dept_idx = np.unique(dept_ids, return_inverse=True)
+    required = np.ones((len(departments), len(course_codes)), dtype=bool)
+    if required_courses is not None:
+        required[:] = False
+        for row, dept_id in enumerate(departments.tolist()):
+            codes = np.fromiter(required_courses.get(dept_id, ()), dtype=np.uint32)
+            required[row] = np.isin(course_codes, codes)
+    required_credits = required.astype(np.int64) @ credits
+
+    lengths = np.array([len(student._course_codes) for student in students], dtype=np.int64)
+    student_idx = np.repeat(np.arange(len(students)), lengths)
+    enrolled = np.concatenate(
+        [np.frombuffer(student._course_codes, dtype=np.uint32) for student in students] or [np.empty(0, np.uint32)]
+    )
+    grade_codes = np.concatenate(
+        [np.frombuffer(student._grade_codes, dtype=np.uint8) for student in students] or [np.empty(0, np.uint8)]
+    )
+    passing = np.ones(len(Student.GRADES), dtype=bool)
+    passing[list(Student._FAILING_CODES)] = False
+
+    course_idx = np.searchsorted(course_codes, enrolled)
+    known = course_idx < len(course_codes)
+    known[known] = course_codes[course_idx[known]] == enrolled[known]
+    keep = known & passing[grade_codes]
+    keep[keep] = required[dept_idx[student_idx[keep]], course_idx[keep]]
+    # A course passed in several semesters still only counts once towards graduation.
+    n_courses = max(len(course_codes), 1)
+    passed = np.unique(student_idx[keep] * n_courses + course_idx[keep])
+    passed_credits = np.bincount(passed // n_courses, weights=credits[passed % n_courses],
+                                 minlength=len(students)).astype(np.int64)
+
+    return CohortTotals(
+        student_ids=np.array([student.id for student in students], dtype=np.int64),
+        dept_ids=dept_ids,
+        quality_points=np.array([student._quality_points for student in students], dtype=np.float64) / Student._QP_SCALE,
+        credits=np.array([student._credits for student in students], dtype=np.int64),
+        remaining_credits=required_credits[dept_idx] - passed_credits,
+    )
+
+
+def project_cgpa(totals: CohortTotals, term_credits: ArrayLike, scenario_points: ArrayLike) -> np.ndarray:
+    term_credits = np.broadcast_to(np.asarray(term_credits, dtype=np.float64), totals.credits.shape)[:, None]
+    scenario_points = np.atleast_1d(np.asarray(scenario_points, dtype=np.float64))[None, :]
+    credits = totals.credits[:, None] + term_credits
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(credits > 0, (totals.quality_points[:, None] + scenario_points * term_credits) / credits, 0.0)
+
+
+def required_average(totals: CohortTotals, targets: ArrayLike, term_credits: ArrayLike,
+                     max_points: Optional[float] = None, tolerance: float = 1e-9) -> Projection:
+    if max_points is None:
+        max_points = max(Student.GRADE_POINTS.values())
+    term_credits = np.broadcast_to(np.asarray(term_credits, dtype=np.float64), totals.credits.shape)[:, None]
+    targets = np.atleast_1d(np.asarray(targets, dtype=np.float64))[None, :]
+    needed = targets * (totals.credits[:, None] + term_credits) - totals.quality_points[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        average = np.where(term_credits > 0, needed / term_credits, np.where(needed <= tolerance, 0.0, np.inf))
+    already_met = needed <= tolerance
+    average = np.where(already_met, 0.0, average)
+    return Projection(required_average=average, feasible=average <= max_points + tolerance, already_met=already_met)
+
+
+def graduation_risk(totals: CohortTotals, minimum_cgpa: ArrayLike = 2.0,
+                    max_points: Optional[float] = None) -> Projection:
+    return required_average(totals, minimum_cgpa, totals.remaining_credits, max_points)
+
+
+def at_risk(totals: CohortTotals, minimum_cgpa: float = 2.0) -> List[int]:
+    projection = graduation_risk(totals, minimum_cgpa)
+    return totals.student_ids[~projection.feasible[:, 0]].tolist()
@@ -0,0 +1,138 @@
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from transcript import GradeChange, Student, StudentObserver
+
+
+class FenwickTree:
+    def __init__(self, size: int):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index: int, delta: int) -> None:
+        index += 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index: int) -> int:
+        total = 0
+        index += 1
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+    def total(self) -> int:
+        return self.prefix_sum(self.size - 1)
+
+
+class DepartmentRanking:
+    def __init__(self, buckets: int):
+        self.counts = FenwickTree(buckets)
+        self.members: Dict[int, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return self.counts.total()
+
+    def add(self, student_id: int, bucket: int) -> None:
+        self.counts.add(bucket, 1)
+        self.members.setdefault(bucket, set()).add(student_id)
+
+    def remove(self, student_id: int, bucket: int) -> None:
+        self.counts.add(bucket, -1)
+        members = self.members[bucket]
+        members.discard(student_id)
+        if not members:
+            del self.members[bucket]
+
+
+class RankingIndex(StudentObserver):
+    def __init__(self, scale: int = 100, max_gpa: Optional[float] = None):
+        if max_gpa is None:
+            max_gpa = max(Student.GRADE_POINTS.values())
+        self.scale = scale
+        self.buckets = int(round(max_gpa * scale)) + 1
+        self.departments: Dict[int, DepartmentRanking] = {}
+        self._entries: Dict[int, Tuple[int, int]] = {}
+        # Observer callbacks arrive from any thread holding a student's lock,
+        # while the department trees are shared across students.
+        self._lock = threading.RLock()
+
+    @classmethod
+    def build(cls, students: Optional[Iterable[Student]] = None, attach: bool = True) -> 'RankingIndex':
+        index = cls()
+        if students is None:
+            students = Student.student_details.values()
+        for student in students:
+            index.update(student)
+        if attach:
+            index.attach()
+        return index
+
+    def _bucket(self, cgpa: float) -> int:
+        return min(max(int(round(cgpa * self.scale)), 0), self.buckets - 1)
+
+    def update(self, student: Student) -> None:
+        entry = (student.dept_id, self._bucket(student.cgpa))
+        with self._lock:
+            previous = self._entries.get(student.id)
+            if previous == entry:
+                return
+            if previous is not None:
+                self.departments[previous[0]].remove(student.id, previous[1])
+            ranking = self.departments.get(entry[0])
+            if ranking is None:
+                ranking = self.departments[entry[0]] = DepartmentRanking(self.buckets)
+            ranking.add(student.id, entry[1])
+            self._entries[student.id] = entry
+
+    def remove(self, student_id: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(student_id, None)
+            if previous is not None:
+                self.departments[previous[0]].remove(student_id, previous[1])
+
+    def student_updated(self, student: Student, changes: List[GradeChange], old_cgpa: float) -> None:
+        self.update(student)
+
+    def department_size(self, dept_id: int) -> int:
+        with self._lock:
+            ranking = self.departments.get(dept_id)
+            return len(ranking) if ranking else 0
+
+    def count_at_least(self, dept_id: int, cgpa: float) -> int:
+        bucket = min(max(math.ceil(round(cgpa * self.scale, 6)), 0), self.buckets)
+        with self._lock:
+            ranking = self.departments.get(dept_id)
+            if ranking is None:
+                return 0
+            below = ranking.counts.prefix_sum(bucket - 1) if bucket > 0 else 0
+            return len(ranking) - below
+
+    def rank(self, student_id: int) -> int:
+        with self._lock:
+            dept_id, bucket = self._entries[student_id]
+            ranking = self.departments[dept_id]
+            return len(ranking) - ranking.counts.prefix_sum(bucket) + 1
+
+    def percentile(self, student_id: int) -> float:
+        with self._lock:
+            dept_id, bucket = self._entries[student_id]
+            ranking = self.departments[dept_id]
+            return 100.0 * ranking.counts.prefix_sum(bucket) / len(ranking)
+
+    def top(self, dept_id: int, n: int) -> List[Tuple[int, float]]:
+        with self._lock:
+            ranking = self.departments.get(dept_id)
+            if ranking is None:
+                return []
+            top: List[Tuple[int, float]] = []
+            for bucket in sorted(ranking.members, reverse=True):
+                cgpa = bucket / self.scale
+                for student_id in sorted(ranking.members[bucket]):
+                    top.append((student_id, cgpa))
+                    if len(top) == n:
+                        return top
+            return top
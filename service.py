@@ -0,0 +1,222 @@
+import argparse
+import asyncio
+import ipaddress
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from batch import render_transcript
+from transcript import Course, Curriculum, Department, GradeChange, Student, StudentObserver
+
+CONTENT_TYPES = {'transcript': 'text/plain; charset=utf-8', 'gpa': 'application/json'}
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+def render_gpa(student: Student) -> str:
+    return json.dumps({
+        'id': student.id,
+        'name': student.fullname(),
+        'dept_id': student.dept_id,
+        'cgpa': student.calculate_cgpa(),
+        'credit_hours': student.total_credit_hour_taken,
+        'semesters': {semester: student.calculate_semester_gpa(semester) for semester in student.semester_order()},
+    })
+
+
+RENDERERS = {'transcript': render_transcript, 'gpa': render_gpa}
+
+
+class TranscriptCache(StudentObserver):
+    def __init__(self, max_bytes: int = 64 << 20):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple[int, str], bytes]' = OrderedDict()
+        self._generations: Dict[int, int] = {}
+        self._curriculum_version = Curriculum.version
+        # Invalidations arrive synchronously from whichever thread updated the
+        # student, so a render started after an update never sees the old body.
+        self._lock = threading.RLock()
+
+    def generation(self, student_id: int) -> int:
+        with self._lock:
+            self._check_curriculum()
+            return self._generations.get(student_id, 0)
+
+    def _check_curriculum(self) -> None:
+        Curriculum.catalog()
+        if Curriculum.version != self._curriculum_version:
+            self._curriculum_version = Curriculum.version
+            self.clear()
+
+    def get(self, student_id: int, kind: str) -> Optional[bytes]:
+        with self._lock:
+            self._check_curriculum()
+            body = self._entries.get((student_id, kind))
+            if body is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end((student_id, kind))
+            return body
+
+    def put(self, student_id: int, kind: str, body: bytes, generation: int) -> None:
+        with self._lock:
+            if generation != self.generation(student_id) or len(body) > self.max_bytes:
+                return
+            previous = self._entries.pop((student_id, kind), None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._entries[student_id, kind] = body
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def invalidate(self, student_id: int) -> None:
+        with self._lock:
+            self._generations[student_id] = self._generations.get(student_id, 0) + 1
+            for kind in RENDERERS:
+                body = self._entries.pop((student_id, kind), None)
+                if body is not None:
+                    self.size -= len(body)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            for student_id in self._generations:
+                self._generations[student_id] += 1
+
+    def student_updated(self, student: Student, changes: List[GradeChange], old_cgpa: float) -> None:
+        self.invalidate(student.id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TranscriptService:
+    def __init__(self, cache: Optional[TranscriptCache] = None, executor: Optional[Executor] = None):
+        self.cache = cache or TranscriptCache()
+        self.executor = executor or ThreadPoolExecutor()
+        self.cache.attach()
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    def _render(self, student: Student, kind: str) -> bytes:
+        return RENDERERS[kind](student).encode('utf-8')
+
+    async def respond(self, method: str, path: str) -> Tuple[int, str, bytes]:
+        if method != 'GET':
+            return 405, 'text/plain', b'Only GET is supported\n'
+        parts = path.split('?', 1)[0].strip('/').split('/')
+        if parts == ['health']:
+            return 200, 'application/json', json.dumps({'students': len(Student.student_details),
+                                                        'cached': len(self.cache)}).encode('utf-8')
+        if len(parts) != 3 or parts[0] != 'students' or parts[2] not in RENDERERS:
+            return 404, 'text/plain', b'Not found\n'
+        try:
+            student_id = int(parts[1])
+        except ValueError:
+            return 400, 'text/plain', b'Student id must be an integer\n'
+
+        kind = parts[2]
+        body = self.cache.get(student_id, kind)
+        if body is None:
+            student = Student.student_details.get(student_id)
+            if student is None:
+                return 404, 'text/plain', f'Student {student_id} not found\n'.encode('utf-8')
+            if student.curriculum_is_stale():
+                student.load_course_list()
+                student.recalculate_totals()
+            generation = self.cache.generation(student_id)
+            loop = asyncio.get_running_loop()
+            body = await loop.run_in_executor(self.executor, self._render, student, kind)
+            self.cache.put(student_id, kind, body, generation)
+        return 200, CONTENT_TYPES[kind], body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, path, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    status, content_type, body = 400, 'text/plain', b'Malformed request line\n'
+                    version = 'HTTP/1.0'
+                else:
+                    status, content_type, body = await self.respond(method, path)
+
+                keep_alive = (version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close')
+                writer.write(
+                    f'{version} {status} {REASONS[status]}\r\n'
+                    f'Content-Type: {content_type}\r\n'
+                    f'Content-Length: {len(body)}\r\n'
+                    f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode('latin-1') + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> asyncio.AbstractServer:
+        if not ipaddress.ip_address(host).is_loopback:
+            raise ValueError(f"Refusing to bind to non-loopback address {host}")
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.cache.detach()
+        self.executor.shutdown(wait=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve transcripts and GPA summaries on localhost")
+    parser.add_argument('--departments', required=True)
+    parser.add_argument('--courses', required=True)
+    parser.add_argument('--curriculum', required=True)
+    parser.add_argument('--students', required=True)
+    parser.add_argument('--grades')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--cache-bytes', type=int, default=64 << 20)
+    args = parser.parse_args()
+
+    Department.from_csv(args.departments)
+    Course.from_csv(args.courses)
+    Curriculum.from_csv(args.curriculum)
+    for student in Student.from_csv(args.students).values():
+        student.load_course_list()
+    if args.grades:
+        Student.grades_from_csv(args.grades)
+
+    async def serve() -> None:
+        service = TranscriptService(TranscriptCache(args.cache_bytes))
+        server = await service.start(args.host, args.port)
+        print(f"Serving on http://{args.host}:{args.port}")
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+
+from transcript import Course, Curriculum, Department, Student
+
+SNAPSHOT_FORMAT = 1
+LOAD_ATTEMPTS = 3
+
+Signature = Tuple[str, int, int, str]
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_signature(path: str, previous: Optional[Signature] = None) -> Signature:
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    if previous is not None and previous[:3] != (path, stat.st_size, stat.st_mtime_ns):
+        return path, stat.st_size, stat.st_mtime_ns, ''
+    return path, stat.st_size, stat.st_mtime_ns, _file_digest(path)
+
+
+def _dump_registries() -> Dict[str, List[tuple]]:
+    return {
+        'departments': [(d.dept_id, d.dept_name) for d in Department.department_details.values()],
+        'courses': [(c.numeric_course_code, c.course_code, c.course_name) for c in Course.course_details.values()],
+        'curriculum': [(c.numeric_course_code, c.credit, c.theory, c.practical, c.ects, c.prerequisite)
+                       for c in Curriculum.Curriculum_details.values()],
+        'students': [(s.id, s.firstname, s.lastname, s.dept_id) for s in Student.student_details.values()],
+    }
+
+
+def _restore_registries(data: Dict[str, List[tuple]]) -> None:
+    Department.department_details = {row[0]: Department(*row) for row in data['departments']}
+    Course.course_details = {row[0]: Course(*row) for row in data['courses']}
+    Curriculum.Curriculum_details = {row[0]: Curriculum(*row) for row in data['curriculum']}
+    Curriculum.catalog()
+    Student.student_details = {row[0]: Student(*row) for row in data['students']}
+
+
+def _read_snapshot(cache_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(cache_path, 'rb') as snapshot:
+            payload = pickle.load(snapshot)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get('format') != SNAPSHOT_FORMAT:
+        return None
+    return payload
+
+
+def _write_snapshot(cache_path: str, payload: Dict[str, Any]) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as snapshot:
+        pickle.dump(payload, snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+
+def load_registries(cache_path: str, departments: Optional[str] = None, courses: Optional[str] = None,
+                    curriculum: Optional[str] = None, students: Optional[str] = None) -> bool:
+    sources = {'departments': departments, 'courses': courses, 'curriculum': curriculum, 'students': students}
+    sources = {name: path for name, path in sources.items() if path is not None}
+
+    payload = _read_snapshot(cache_path)
+    if payload is not None and set(payload['sources']) == set(sources):
+        try:
+            signatures = {name: source_signature(path, payload['sources'][name]) for name, path in sources.items()}
+        except FileNotFoundError:
+            signatures = None
+        if signatures == payload['sources']:
+            _restore_registries(payload['registries'])
+            return True
+
+    # Sign the sources before parsing and again afterwards, so a file that
+    # changes mid-parse is reloaded rather than cached under its new signature.
+    for _ in range(LOAD_ATTEMPTS):
+        try:
+            signatures = {name: source_signature(path) for name, path in sources.items()}
+        except FileNotFoundError:
+            signatures = None
+        _parse_sources(sources)
+        if signatures is None:
+            return False
+        try:
+            unchanged = all(source_signature(path, signatures[name]) == signatures[name]
+                            for name, path in sources.items())
+        except FileNotFoundError:
+            return False
+        if unchanged:
+            _write_snapshot(cache_path, {'format': SNAPSHOT_FORMAT, 'sources': signatures,
+                                         'registries': _dump_registries()})
+            return False
+    return False
+
+
+def _parse_sources(sources: Dict[str, str]) -> None:
+    Department.department_details = {}
+    Course.course_details = {}
+    Student.student_details = {}
+    # Curriculum validation needs the course catalog, so courses load first.
+    if 'departments' in sources:
+        Department.from_csv(sources['departments'])
+    if 'courses' in sources:
+        Course.from_csv(sources['courses'])
+    if 'curriculum' in sources:
+        Curriculum.from_csv(sources['curriculum'])
+    if 'students' in sources:
+        Student.from_csv(sources['students'])
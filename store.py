@@ -0,0 +1,330 @@
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+from weakref import WeakValueDictionary
+
+from transcript import (Course, Curriculum, Department, GradeChange, LoadReport, Student, StudentObserver,
+                        read_csv_rows)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS departments (
+    dept_id INTEGER PRIMARY KEY,
+    dept_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS courses (
+    numeric_course_code INTEGER PRIMARY KEY,
+    course_code TEXT NOT NULL,
+    course_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS curriculum (
+    numeric_course_code INTEGER PRIMARY KEY,
+    credit INTEGER NOT NULL,
+    theory INTEGER NOT NULL,
+    practical INTEGER NOT NULL,
+    ects REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS prerequisites (
+    numeric_course_code INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    prerequisite INTEGER NOT NULL,
+    PRIMARY KEY (numeric_course_code, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    firstname TEXT NOT NULL,
+    lastname TEXT NOT NULL,
+    dept_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS students_dept_id ON students (dept_id);
+CREATE TABLE IF NOT EXISTS enrollments (
+    student_id INTEGER NOT NULL,
+    semester TEXT NOT NULL,
+    numeric_course_code INTEGER NOT NULL,
+    grade TEXT NOT NULL,
+    PRIMARY KEY (student_id, semester, numeric_course_code)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS enrollments_course ON enrollments (numeric_course_code);
+CREATE INDEX IF NOT EXISTS enrollments_semester ON enrollments (semester);
+CREATE TABLE IF NOT EXISTS grade_points (
+    grade TEXT PRIMARY KEY,
+    points REAL NOT NULL
+);
+"""
+
+TOTALS_SQL = """
+SELECT e.student_id, SUM(g.points * c.credit), SUM(c.credit)
+FROM enrollments e
+LEFT JOIN curriculum c ON c.numeric_course_code = e.numeric_course_code
+LEFT JOIN grade_points g ON g.grade = e.grade
+"""
+
+
+def _gpa(quality_points: Optional[float], credits: Optional[int]) -> float:
+    if not credits:
+        return 0.0
+    return round(quality_points / credits, 2)
+
+
+class StoredStudents(Mapping[int, Student]):
+    def __init__(self, store: 'SQLiteStore', dept_id: Optional[int] = None, page_size: int = 1000):
+        self.store = store
+        self.dept_id = dept_id
+        self.page_size = page_size
+
+    def _where(self, clause: str = '') -> Tuple[str, tuple]:
+        conditions = [clause] if clause else []
+        params: tuple = ()
+        if self.dept_id is not None:
+            conditions.append('dept_id = ?')
+            params = (self.dept_id,)
+        return (' WHERE ' + ' AND '.join(conditions)) if conditions else '', params
+
+    def __getitem__(self, student_id: int) -> Student:
+        where, params = self._where('id = ?')
+        row = self.store._fetchone(
+            f'SELECT id, firstname, lastname, dept_id FROM students{where}', (student_id,) + params
+        )
+        if row is None:
+            raise KeyError(student_id)
+        return self.store._materialize([row])[0]
+
+    def __iter__(self) -> Iterator[int]:
+        last_id = None
+        while True:
+            where, params = self._where('' if last_id is None else 'id > ?')
+            if last_id is not None:
+                params = (last_id,) + params
+            ids = [student_id for student_id, in self.store._fetchall(
+                f'SELECT id FROM students{where} ORDER BY id LIMIT ?', params + (self.page_size,)
+            )]
+            if not ids:
+                return
+            yield from ids
+            last_id = ids[-1]
+
+    def __len__(self) -> int:
+        where, params = self._where()
+        return self.store._fetchone(f'SELECT COUNT(*) FROM students{where}', params)[0]
+
+    def __contains__(self, student_id: object) -> bool:
+        where, params = self._where('id = ?')
+        return self.store._fetchone(f'SELECT 1 FROM students{where}', (student_id,) + params) is not None
+
+    def pages(self) -> Iterator[List[Student]]:
+        last_id = None
+        while True:
+            where, params = self._where('' if last_id is None else 'id > ?')
+            if last_id is not None:
+                params = (last_id,) + params
+            rows = self.store._fetchall(
+                f'SELECT id, firstname, lastname, dept_id FROM students{where} ORDER BY id LIMIT ?',
+                params + (self.page_size,)
+            )
+            if not rows:
+                return
+            yield self.store._materialize(rows)
+            last_id = rows[-1][0]
+
+    def values(self) -> Iterator[Student]:
+        for page in self.pages():
+            yield from page
+
+
+class SQLiteStore(StudentObserver):
+    def __init__(self, path: str):
+        self.path = path
+        # One connection shared by every thread (e.g. the service's executor),
+        # so all access goes through self.lock.
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.RLock()
+        self._students: 'WeakValueDictionary[int, Student]' = WeakValueDictionary()
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+        self.connection.executescript(SCHEMA)
+        with self.connection:
+            self.connection.executemany('INSERT OR REPLACE INTO grade_points VALUES (?, ?)',
+                                        Student.GRADE_POINTS.items())
+
+    def close(self) -> None:
+        self.detach()
+        with self.lock:
+            self.connection.close()
+
+    def _fetchall(self, sql: str, params: tuple = ()) -> List[Tuple[Any, ...]]:
+        with self.lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def _fetchone(self, sql: str, params: tuple = ()) -> Optional[Tuple[Any, ...]]:
+        with self.lock:
+            return self.connection.execute(sql, params).fetchone()
+
+    def __enter__(self) -> 'SQLiteStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _bulk_insert(self, file_path: str, schema, sql: str) -> LoadReport:
+        report = LoadReport(file_path)
+
+        def rows():
+            for _, values in read_csv_rows(file_path, schema, report):
+                report.rows_loaded += 1
+                yield values
+
+        with self.lock, self.connection:
+            self.connection.executemany(sql, rows())
+        return report
+
+    def load_departments(self, file_path: str) -> LoadReport:
+        return self._bulk_insert(file_path, Department.CSV_SCHEMA, 'INSERT OR REPLACE INTO departments VALUES (?, ?)')
+
+    def load_courses(self, file_path: str) -> LoadReport:
+        return self._bulk_insert(file_path, Course.CSV_SCHEMA, 'INSERT OR REPLACE INTO courses VALUES (?, ?, ?)')
+
+    def load_students(self, file_path: str) -> LoadReport:
+        return self._bulk_insert(file_path, Student.CSV_SCHEMA, 'INSERT OR REPLACE INTO students VALUES (?, ?, ?, ?)')
+
+    def load_curriculum(self, file_path: str) -> LoadReport:
+        report = LoadReport(file_path)
+        courses = {code for code, in self._fetchall('SELECT numeric_course_code FROM courses')}
+        rows = []
+        prerequisites = []
+        for line, (code, credit, theory, practical, ects, prerequisite) in read_csv_rows(
+                file_path, Curriculum.CSV_SCHEMA, report):
+            if code not in courses:
+                report.add_error(line, f"Course {code} not found")
+                continue
+            missing = [prerequisite_code for prerequisite_code in prerequisite if prerequisite_code not in courses]
+            if missing:
+                report.add_error(line, f"Prerequisite {missing[0]} not found")
+                continue
+            rows.append((code, credit, theory, practical, ects))
+            prerequisites.extend((code, position, value) for position, value in enumerate(prerequisite))
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM prerequisites')
+            self.connection.execute('DELETE FROM curriculum')
+            self.connection.executemany('INSERT INTO curriculum VALUES (?, ?, ?, ?, ?)', rows)
+            self.connection.executemany('INSERT INTO prerequisites VALUES (?, ?, ?)', prerequisites)
+        report.rows_loaded = len(rows)
+        return report
+
+    def load_grades(self, file_path: str) -> LoadReport:
+        report = LoadReport(file_path)
+        grades = Student.GRADE_CODES
+
+        def rows():
+            for line, (student_id, semester, code, grade) in read_csv_rows(file_path, Student.GRADE_SCHEMA, report):
+                grade = grade.upper()
+                if grade not in grades:
+                    report.add_error(line, f"Invalid grade '{grade}'")
+                    continue
+                report.rows_loaded += 1
+                yield student_id, semester, code, grade
+
+        with self.lock, self.connection:
+            self.connection.executemany('INSERT OR REPLACE INTO enrollments VALUES (?, ?, ?, ?)', rows())
+        return report
+
+    def load_catalogs(self) -> None:
+        Department.department_details = {
+            row[0]: Department(*row) for row in self._fetchall('SELECT dept_id, dept_name FROM departments')
+        }
+        Course.course_details = {
+            row[0]: Course(*row)
+            for row in self._fetchall('SELECT numeric_course_code, course_code, course_name FROM courses')
+        }
+        prerequisites: Dict[int, List[int]] = {}
+        for code, prerequisite in self._fetchall(
+                'SELECT numeric_course_code, prerequisite FROM prerequisites ORDER BY numeric_course_code, position'):
+            prerequisites.setdefault(code, []).append(prerequisite)
+        Curriculum.Curriculum_details = {
+            row[0]: Curriculum(*row, prerequisites.get(row[0], []))
+            for row in self._fetchall(
+                'SELECT numeric_course_code, credit, theory, practical, ects FROM curriculum')
+        }
+        Curriculum.catalog()
+
+    def students(self, dept_id: Optional[int] = None, page_size: int = 1000) -> StoredStudents:
+        return StoredStudents(self, dept_id, page_size)
+
+    def attach(self) -> 'SQLiteStore':
+        self.load_catalogs()
+        Student.student_details = self.students()
+        super().attach()
+        return self
+
+    def _materialize(self, rows: List[Tuple[int, str, str, int]]) -> List[Student]:
+        # Live objects are shared so two lookups of one id see the same changes.
+        # New objects take their stripe lock in load_course_list, so they are
+        # built before self.lock is taken; student_updated locks the other way.
+        with self.lock:
+            students = {row[0]: self._students.get(row[0]) for row in rows}
+        loaded = {}
+        for student_id, firstname, lastname, dept_id in rows:
+            if students[student_id] is None:
+                student = loaded[student_id] = Student(student_id, firstname, lastname, dept_id)
+                student.load_course_list()
+        if not loaded:
+            return list(students.values())
+
+        with self.lock:
+            enrollments: Dict[int, Dict[str, List[Tuple[int, str]]]] = {
+                student_id: {} for student_id in loaded if student_id not in self._students
+            }
+            if enrollments:
+                for student_id, semester, code, grade in self.connection.execute(
+                        'SELECT student_id, semester, numeric_course_code, grade FROM enrollments '
+                        'WHERE student_id BETWEEN ? AND ? ORDER BY student_id',
+                        (min(enrollments), max(enrollments))):
+                    courses_taken = enrollments.get(student_id)
+                    if courses_taken is not None:
+                        courses_taken.setdefault(semester, []).append((code, grade))
+            for student_id, courses_taken in enrollments.items():
+                if courses_taken:
+                    loaded[student_id]._load_courses(courses_taken)
+                self._students[student_id] = loaded[student_id]
+            for student_id in loaded:
+                students[student_id] = self._students[student_id]
+        return list(students.values())
+
+    def student_updated(self, student: Student, changes: List[GradeChange], old_cgpa: float) -> None:
+        with self.lock, self.connection:
+            for semester, code, _, new_grade in changes:
+                if new_grade is None:
+                    self.connection.execute(
+                        'DELETE FROM enrollments WHERE student_id = ? AND semester = ? AND numeric_course_code = ?',
+                        (student.id, semester, code)
+                    )
+                else:
+                    self.connection.execute('INSERT OR REPLACE INTO enrollments VALUES (?, ?, ?, ?)',
+                                            (student.id, semester, code, new_grade))
+
+    def credit_hours(self, student_id: int) -> int:
+        row = self._fetchone(TOTALS_SQL + ' WHERE e.student_id = ?', (student_id,))
+        return row[2] or 0
+
+    def cgpa(self, student_id: int) -> float:
+        row = self._fetchone(TOTALS_SQL + ' WHERE e.student_id = ?', (student_id,))
+        return _gpa(row[1], row[2])
+
+    def semester_gpa(self, student_id: int) -> Dict[str, float]:
+        return {
+            semester: _gpa(quality_points, credits)
+            for semester, quality_points, credits in self._fetchall(
+                'SELECT e.semester, SUM(g.points * c.credit), SUM(c.credit) FROM enrollments e '
+                'LEFT JOIN curriculum c ON c.numeric_course_code = e.numeric_course_code '
+                'LEFT JOIN grade_points g ON g.grade = e.grade '
+                'WHERE e.student_id = ? GROUP BY e.semester', (student_id,))
+        }
+
+    def cohort_totals(self, dept_id: Optional[int] = None) -> Dict[int, Tuple[float, int]]:
+        if dept_id is None:
+            rows = self._fetchall(TOTALS_SQL + ' GROUP BY e.student_id')
+        else:
+            rows = self._fetchall(
+                TOTALS_SQL + ' JOIN students s ON s.id = e.student_id WHERE s.dept_id = ? GROUP BY e.student_id',
+                (dept_id,)
+            )
+        return {student_id: (_gpa(quality_points, credits), credits or 0)
+                for student_id, quality_points, credits in rows}
@@ -0,0 +1,56 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from transcript import Course, Curriculum, Department, Student
+
+
+@pytest.fixture
+def catalog():
+    Department.department_details = {
+        389: Department(389, "Software Engineering"),
+        355: Department(355, "Computer Engineering"),
+    }
+    Course.course_details = {
+        3570100: Course(3570100, "CS100", "Pre-Intro Course"),
+        3570119: Course(3570119, "CS101", "Intro Course"),
+        3580105: Course(3580105, "CS102", "Data Structures"),
+        3600107: Course(3600107, "CS103", "Algorithms"),
+        3550100: Course(3550100, "SEM101", "Department Seminar"),
+    }
+    Curriculum.Curriculum_details = {
+        3570100: Curriculum(3570100, 3, 3, 0, 5.0, []),
+        3570119: Curriculum(3570119, 5, 4, 2, 7.5, [3570100]),
+        3580105: Curriculum(3580105, 4, 3, 2, 6.5, []),
+        3600107: Curriculum(3600107, 4, 3, 2, 6.0, []),
+        3550100: Curriculum(3550100, 0, 2, 0, 1.0, []),
+    }
+    Student.student_details = {}
+    Student.observers = []
+    Student.locks = None
+    yield Curriculum.Curriculum_details
+    Student.student_details = {}
+    Student.observers = []
+    Student.locks = None
+
+
+@pytest.fixture
+def sources(tmp_path):
+    shutil.copy(os.path.join(ROOT, "Department.csv"), tmp_path / "departments.csv")
+    shutil.copy(os.path.join(ROOT, "students.csv"), tmp_path / "students.csv")
+    (tmp_path / "courses.csv").write_text(
+        "numeric_course_code,course_code,course_name\n"
+        "3570100,CS100,Pre-Intro Course\n"
+        "3570119,CS101,Intro Course\n"
+    )
+    (tmp_path / "curriculum.csv").write_text(
+        "Numerical_Code,Credit,Theory,Pratical,ECTS,Prequesite\n"
+        "3570100,3,3,0,5.0,Null\n"
+        "3570119,5,4,2,7.5,3570100\n"
+    )
+    return {name: str(tmp_path / f"{name}.csv") for name in ("departments", "courses", "curriculum", "students")}
@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from aggregates import GradeAggregates, RunningStats
+from transcript import Student
+
+
+def enroll(student_id, dept_id, records):
+    student = Student(student_id, "First", "Last", dept_id)
+    student.load_course_list()
+    student.add_courses(records)
+    Student.student_details[student_id] = student
+    return student
+
+
+def test_running_stats_add_and_remove():
+    stats = RunningStats()
+    for value in (4.0, 3.0, 2.0, 3.7):
+        stats.add(value)
+    stats.remove(2.0)
+    assert stats.n == 3
+    assert stats.mean == pytest.approx(3.5666666, rel=1e-6)
+    assert stats.variance == pytest.approx(((4 - 3.5666666) ** 2 + (3 - 3.5666666) ** 2 + (3.7 - 3.5666666) ** 2) / 3)
+
+
+def test_aggregates_follow_inserts_and_replacements(catalog):
+    enroll(1, 389, [("Fall 2023", 3580105, "A"), ("Fall 2023", 3600107, "B")])
+    aggregates = GradeAggregates.build()
+    second = enroll(2, 389, [("Fall 2023", 3580105, "C")])
+    enroll(3, 355, [("Fall 2023", 3580105, "B+"), ("Fall 2023", 3550100, "A")])
+
+    assert aggregates.course_histogram(3580105)["A"] == 1
+    assert aggregates.course_mean(3580105) == pytest.approx((4.0 + 2.0 + 3.3) / 3)
+    assert aggregates.department_mean_cgpa(389) == pytest.approx((3.5 + 2.0) / 2)
+
+    second.add_course("Fall 2023", 3580105, "A-")
+    second.add_course("Spring 2024", 3580105, "A")
+    histogram = aggregates.course_histogram(3580105)
+    assert (histogram["A"], histogram["A-"], histogram["C"]) == (2, 1, 0)
+    assert aggregates.department_mean_cgpa(389) == pytest.approx((3.5 + 3.85) / 2)
+    assert aggregates.course_mean(3570119) is None
+
+    second.courses_taken = {"Fall 2023": [(3600107, "D")]}
+    assert aggregates.verify() == []
+    assert aggregates.course_histogram(3600107)["D"] == 1
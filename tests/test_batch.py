@@ -0,0 +1,35 @@
+from batch import generate_transcripts, render_transcript
+from transcript import Student
+
+
+def make_students(count):
+    students = []
+    for student_id in range(1, count + 1):
+        student = Student(student_id, f"First{student_id}", "Last", 389 if student_id % 2 else 355)
+        student.load_course_list()
+        student.add_course("Fall 2023", 3580105, "A")
+        student.add_course("Spring 2024", 3600107, "B" if student_id % 3 else "C")
+        students.append(student)
+    return students
+
+
+def test_render_transcript(catalog):
+    student = make_students(1)[0]
+    text = render_transcript(student)
+
+    assert "Name: Last First1" in text
+    assert "Department: Software Engineering" in text
+    assert "CS102" in text and "Data Structures" in text
+    assert "Semester GPA: 4.00" in text
+    assert "Total Credit Hours: 8" in text
+    assert text.endswith("CGPA: 3.50\n\n")
+
+
+def test_generate_transcripts_matches_serial_rendering(catalog, tmp_path):
+    students = make_students(25)
+    written = generate_transcripts(str(tmp_path), students, max_workers=2, chunk_size=4, max_in_flight=2)
+
+    assert written == {389: 13, 355: 12}
+    for dept_id in (389, 355):
+        expected = "".join(render_transcript(s) for s in students if s.dept_id == dept_id)
+        assert (tmp_path / f"transcripts_{dept_id}.txt").read_text(encoding="utf-8") == expected
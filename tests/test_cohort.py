@@ -0,0 +1,112 @@
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cohort import CohortEngine, _round2
+from transcript import Curriculum, GradingScheme, Student
+
+
+def test_cohort_matches_student_methods(catalog):
+    grades = ["A", "A-", "B+", "B", "C-", "D+", "F"]
+    codes = [3570100, 3580105, 3600107, 3550100]
+    students = []
+    for student_id in range(1, 13):
+        student = Student(student_id, "First", "Last", 389)
+        student.load_course_list()
+        for offset, code in enumerate(codes[:student_id % 4 + 1]):
+            semester = "Fall 2023" if offset % 2 else "Spring 2024"
+            student.add_course(semester, code, grades[(student_id + offset) % len(grades)])
+        students.append(student)
+    students.append(Student(99, "No", "Courses", 355))
+
+    result, arrays = CohortEngine().compute_students(students)
+
+    for row, student in enumerate(students):
+        assert result.cgpa[row] == student.calculate_cgpa()
+        assert result.credit_hours[row] == student.total_credit_hour_taken
+        for column, semester in enumerate(arrays.semesters):
+            expected = student.calculate_semester_gpa(semester)
+            if expected is None:
+                assert math.isnan(result.semester_gpa[row, column])
+            else:
+                assert result.semester_gpa[row, column] == expected
+
+
+def test_cohort_matches_students_with_replacements(catalog, monkeypatch):
+    monkeypatch.setattr(Student, "enforce_prerequisites", False)
+    Curriculum.Curriculum_details = {
+        **catalog, **{code: Curriculum(code, 1 + code % 6, 3, 0, 5.0, []) for code in range(3700000, 3700040)}
+    }
+    codes = list(Curriculum.catalog())
+    semesters = ["Fall 2023", "Spring 2024", "Fall 2024"]
+    rng = random.Random(153)
+    students = []
+    for student_id in range(2000):
+        student = Student(student_id, "First", "Last", 389)
+        student.load_course_list()
+        for _ in range(rng.randint(0, 30)):
+            student.add_course(rng.choice(semesters), rng.choice(codes), rng.choice(Student.GRADES))
+        students.append(student)
+
+    result, arrays = CohortEngine().compute_students(students)
+
+    for row, student in enumerate(students):
+        assert result.cgpa[row] == student.cgpa
+        for column, semester in enumerate(arrays.semesters):
+            expected = student.calculate_semester_gpa(semester)
+            if expected is not None:
+                assert result.semester_gpa[row, column] == expected
+
+
+def test_unknown_courses_carry_no_credit(catalog):
+    engine = CohortEngine([3580105])
+    result = engine.compute(
+        np.array([0, 0]),
+        np.array([0, engine.unknown_course]),
+        np.array([0, 1]),
+        np.array([engine.grade_index["B"], engine.grade_index["A"]])
+    )
+    assert result.cgpa.tolist() == [3.0]
+    assert result.credit_hours.tolist() == [4]
+    assert result.semester_gpa.tolist() == [[3.0, 0.0]]
+
+
+def test_grading_schemes_in_one_pass(catalog):
+    scale = GradingScheme("scale_10", {grade: points * 2.5 for grade, points in Student.GRADE_POINTS.items()}, "ects")
+    schemes = Student.grading_schemes + (scale,)
+    students = []
+    for student_id, grades in enumerate([["A", "B", "F"], ["C+", "A-", "D"], []]):
+        student = Student(student_id, "First", "Last", 389)
+        student.load_course_list()
+        for code, grade in zip((3570100, 3580105, 3600107), grades):
+            student.add_course("Fall 2023", code, grade)
+        students.append(student)
+
+    summary = students[0].grade_summary(schemes)
+    assert summary.averages["gpa"] == students[0].calculate_cgpa() == 2.18
+    assert summary.averages["ects_average"] == round((4.0 * 5.0 + 3.0 * 6.5) / 17.5, 2)
+    assert summary.averages["scale_10"] == round((10.0 * 5.0 + 7.5 * 6.5) / 17.5, 2)
+    assert (summary.credits, summary.ects_attempted, summary.ects_earned) == (11, 17.5, 11.5)
+
+    engine = CohortEngine()
+    arrays = engine.enrollment_arrays(students)
+    result = engine.compute_schemes(arrays.student_idx, arrays.course_idx, arrays.grade_code,
+                                    len(students), schemes)
+    for row, student in enumerate(students):
+        expected = student.grade_summary(schemes)
+        assert {name: values[row] for name, values in result.averages.items()} == expected.averages
+        assert result.credits[row] == expected.credits
+        assert result.ects_earned[row] == expected.ects_earned
+        assert result.ects_attempted[row] == expected.ects_attempted
+
+    with pytest.raises(ValueError):
+        GradingScheme("partial", {"A": 4.0})
+
+
+def test_round2_matches_python_round_at_ties():
+    values = np.array([[2.675, 1.005, np.nan], [0.125, 3.14159, 2.5]])
+    expected = [[round(value, 2) for value in row] for row in values.tolist()]
+    np.testing.assert_array_equal(_round2(values), np.array(expected))
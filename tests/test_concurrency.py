@@ -0,0 +1,140 @@
+import random
+import sys
+import threading
+
+import pytest
+
+from ranking import RankingIndex
+from transcript import CourseEnrollmentIndex, Curriculum, ShardedRegistry, Student
+
+CODES = (3570100, 3580105, 3600107)
+GRADES = ("A", "B+", "C", "D", "F")
+
+
+def test_concurrent_grade_entry_keeps_totals_consistent(catalog):
+    registry = Student.use_sharded_registry(shards=4)
+    assert isinstance(Student.student_details, ShardedRegistry)
+    for student_id in range(40):
+        student = Student(student_id, "First", "Last", 389)
+        student.load_course_list()
+        Student.student_details[student_id] = student
+
+    written = set()
+    written_lock = threading.Lock()
+    errors = []
+    done = threading.Event()
+
+    def enter_grades(seed):
+        rng = random.Random(seed)
+        try:
+            for _ in range(3000):
+                student_id = rng.randrange(8)
+                semester = f"Fall {1900 + rng.randrange(60)}"
+                code = rng.choice(CODES)
+                registry[student_id].add_course(semester, code, rng.choice(GRADES))
+                with written_lock:
+                    written.add((student_id, semester, code))
+        except Exception as e:
+            errors.append(e)
+
+    def reload_curriculum():
+        contents = dict(Curriculum.Curriculum_details)
+        while not done.is_set():
+            Curriculum.Curriculum_details = dict(contents)
+            published = Curriculum.published()
+            if len(published.catalog) != len(contents) or published.graph.codes != list(contents):
+                errors.append(AssertionError("partially published catalog"))
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        reloader = threading.Thread(target=reload_curriculum)
+        reloader.start()
+        workers = [threading.Thread(target=enter_grades, args=(seed,)) for seed in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        done.set()
+        reloader.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors
+    assert all(Student._semester_ids[name] == code for code, name in enumerate(Student._semester_names))
+    enrollments = 0
+    for student in registry.values():
+        student._verify_totals()
+        assert student.total_credit_hour_taken == student._compute_totals()[1]
+        enrollments += sum(len(courses) for courses in student.courses_taken.values())
+    assert enrollments == len(written)
+
+
+def test_lazy_students_concurrent_lookups(catalog, tmp_path):
+    path = tmp_path / "students.csv"
+    path.write_text("id,firstname,lastname,dept_id\n" +
+                    "".join(f"{n},First{n},Last{n},389\n" for n in range(2000)))
+    errors = []
+
+    def lookup(seed):
+        rng = random.Random(seed)
+        for _ in range(2000):
+            student_id = rng.randrange(2000)
+            try:
+                student = students[student_id]
+                if (student.id, student.firstname) != (student_id, f"First{student_id}"):
+                    errors.append((student_id, student.id))
+            except Exception as e:
+                errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with Student.from_csv_lazy(str(path), max_cached=1) as students:
+            workers = [threading.Thread(target=lookup, args=(seed,)) for seed in range(8)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert not errors
+
+
+def test_observers_stay_consistent_under_concurrent_writes(catalog):
+    aggregates_module = pytest.importorskip("aggregates")
+    registry = Student.use_sharded_registry(shards=8)
+    for student_id in range(64):
+        student = Student(student_id, "First", "Last", 389)
+        student.load_course_list()
+        Student.student_details[student_id] = student
+    ranking = RankingIndex.build()
+    enrollments = CourseEnrollmentIndex.build()
+    aggregates = aggregates_module.GradeAggregates.build()
+    errors = []
+
+    def enter_grades(seed):
+        rng = random.Random(seed)
+        try:
+            for _ in range(5000):
+                registry[rng.randrange(64)].add_course(f"Fall {2000 + rng.randrange(4)}",
+                                                       rng.choice(CODES), rng.choice(GRADES))
+        except Exception as e:
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        workers = [threading.Thread(target=enter_grades, args=(seed,)) for seed in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors
+    assert ranking.department_size(389) == 64
+    assert ranking._entries == RankingIndex.build(attach=False)._entries
+    assert enrollments.enrollments == CourseEnrollmentIndex.build(attach=False).enrollments
+    assert aggregates.verify() == []
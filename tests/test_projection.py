@@ -0,0 +1,47 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from projection import at_risk, cohort_totals, graduation_risk, project_cgpa, required_average
+from transcript import Student
+
+
+def enroll(student_id, dept_id, records):
+    student = Student(student_id, "First", "Last", dept_id)
+    student.load_course_list()
+    for semester, code, grade in records:
+        student.add_course(semester, code, grade)
+    return student
+
+
+def test_projection_and_graduation_risk(catalog):
+    students = [
+        enroll(1, 389, [("Fall 2023", 3570100, "A"), ("Fall 2023", 3580105, "A")]),
+        enroll(2, 389, [("Fall 2023", 3570100, "F"), ("Spring 2024", 3570100, "D"), ("Fall 2023", 3580105, "F"),
+                        ("Fall 2023", 3600107, "F")]),
+        enroll(3, 355, [("Fall 2023", 3580105, "C")]),
+        enroll(4, 355, []),
+    ]
+    totals = cohort_totals(students, required_courses={389: [3570100, 3570119, 3580105, 3600107],
+                                                       355: [3580105, 3600107]})
+    assert totals.credits.tolist() == [7, 14, 4, 0]
+    assert totals.remaining_credits.tolist() == [9, 13, 4, 8]
+
+    projected = project_cgpa(totals, 4, [4.0, 2.0])
+    for row, student in enumerate(students):
+        for column, points in enumerate([4.0, 2.0]):
+            expected = (student._quality_points / Student._QP_SCALE + points * 4) / (student._credits + 4)
+            assert projected[row, column] == pytest.approx(expected)
+
+    projection = required_average(totals, [2.0, 3.9], 5)
+    assert projection.already_met[0].tolist() == [True, False]
+    assert projection.required_average[0].tolist() == [0.0, pytest.approx((3.9 * 12 - 28.0) / 5)]
+    assert projection.feasible[0].tolist() == [True, True]
+    assert projection.required_average[2, 0] == pytest.approx((2.0 * 9 - 8.0) / 5)
+    assert projection.feasible[1].tolist() == [False, False]
+    assert projection.required_average[3, 0] == 2.0
+
+    risk = graduation_risk(totals, 2.0)
+    assert risk.required_average[1, 0] == pytest.approx((2.0 * 27 - 3.0) / 13)
+    assert at_risk(totals, 2.0) == []
+    assert at_risk(totals, 2.5) == [2]
@@ -0,0 +1,39 @@
+from ranking import RankingIndex
+from transcript import Student
+
+
+def enroll(student_id, dept_id, grades):
+    student = Student(student_id, "First", "Last", dept_id)
+    student.load_course_list()
+    for code, grade in zip((3580105, 3600107), grades):
+        student.add_course("Fall 2023", code, grade)
+    Student.student_details[student_id] = student
+    return student
+
+
+def test_ranking_tracks_cgpa_changes(catalog):
+    enroll(1, 389, ["A", "A"])
+    enroll(2, 389, ["B", "B"])
+    enroll(3, 389, ["B", "B"])
+    enroll(4, 389, ["C", "D"])
+    enroll(5, 355, ["F", "F"])
+    index = RankingIndex.build()
+
+    assert index.rank(1) == 1
+    assert index.rank(2) == index.rank(3) == 2
+    assert index.rank(4) == 4
+    assert index.percentile(4) == 25.0
+    assert index.top(389, 3) == [(1, 4.0), (2, 3.0), (3, 3.0)]
+    assert index.count_at_least(389, 3.0) == 3
+    assert index.count_at_least(389, 3.01) == 1
+    assert index.department_size(355) == 1
+
+    Student.student_details[4].add_course("Spring 2024", 3570100, "A")
+    Student.student_details[4].add_course("Fall 2023", 3600107, "A")
+    assert Student.student_details[4].cgpa == 3.27
+    assert index.rank(4) == 2
+    assert index.top(389, 2) == [(1, 4.0), (4, 3.27)]
+
+    late = enroll(6, 355, ["A", "B"])
+    assert index.rank(late.id) == 1
+    assert index.department_size(355) == 2
@@ -0,0 +1,82 @@
+import asyncio
+import json
+import threading
+
+from service import TranscriptCache, TranscriptService
+from transcript import Curriculum, Student
+
+
+async def fetch(port, path):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nConnection: close\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), body.decode("utf-8")
+
+
+def test_service_caches_and_invalidates(catalog):
+    student = Student(7, "Ada", "Lovelace", 389)
+    student.load_course_list()
+    student.add_course("Fall 2023", 3570100, "A")
+    Student.student_details[7] = student
+
+    async def scenario():
+        service = TranscriptService(TranscriptCache())
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            status, body = await fetch(port, "/students/7/gpa")
+            assert status == 200 and json.loads(body)["cgpa"] == 4.0
+            status, body = await fetch(port, "/students/7/transcript")
+            assert status == 200 and "Fall 2023" in body
+            await fetch(port, "/students/7/gpa")
+            assert (service.cache.hits, service.cache.misses) == (1, 2)
+
+            student.add_course("Spring 2024", 3570119, "C")
+            assert len(service.cache) == 0
+            status, body = await fetch(port, "/students/7/gpa")
+            assert json.loads(body)["cgpa"] == 2.75
+
+            Curriculum.Curriculum_details = dict(Curriculum.Curriculum_details)
+            del Curriculum.Curriculum_details[3570119]
+            status, body = await fetch(port, "/students/7/gpa")
+            assert json.loads(body)["cgpa"] == 4.0
+
+            await fetch(port, "/students/7/gpa")
+            generation = service.cache.generation(7)
+            updater = threading.Thread(target=student.add_course, args=("Spring 2024", 3570100, "B"))
+            updater.start()
+            updater.join()
+            assert service.cache.get(7, "gpa") is None
+            assert service.cache.generation(7) == generation + 1
+
+            assert (await fetch(port, "/students/8/gpa"))[0] == 404
+            assert (await fetch(port, "/students/x/gpa"))[0] == 400
+            assert (await fetch(port, "/nothing"))[0] == 404
+        finally:
+            await service.close()
+
+    asyncio.run(scenario())
+    assert service_detached()
+
+
+def service_detached():
+    return not any(isinstance(observer, TranscriptCache) for observer in Student.observers)
+
+
+def test_cache_is_size_bounded():
+    cache = TranscriptCache(max_bytes=10)
+    cache.put(1, "gpa", b"aaaa", cache.generation(1))
+    cache.put(2, "gpa", b"bbbb", cache.generation(2))
+    cache.get(1, "gpa")
+    cache.put(3, "gpa", b"cccc", cache.generation(3))
+    assert cache.get(2, "gpa") is None
+    assert cache.get(1, "gpa") == b"aaaa"
+    assert cache.size == 8
+
+    stale = cache.generation(1)
+    cache.invalidate(1)
+    cache.put(1, "gpa", b"old", stale)
+    assert cache.get(1, "gpa") is None
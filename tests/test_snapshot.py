@@ -0,0 +1,59 @@
+import os
+
+from snapshot import load_registries
+from transcript import Course, Curriculum, Department, Student
+
+
+def test_snapshot_round_trip_and_invalidation(catalog, sources, tmp_path):
+    cache_path = str(tmp_path / "registries.snapshot")
+
+    assert load_registries(cache_path, **sources) is False
+    assert os.path.exists(cache_path)
+    expected_students = {s.id: s.fullname() for s in Student.student_details.values()}
+
+    Student.student_details = {}
+    Curriculum.Curriculum_details = {}
+    assert load_registries(cache_path, **sources) is True
+    assert {s.id: s.fullname() for s in Student.student_details.values()} == expected_students
+    assert Curriculum.catalog()[3570119].prerequisite == [3570100]
+    assert Course.course_details[3570119].course_name == "Intro Course"
+    assert Department.department_details[384].dept_name == "Aerospace Engineering"
+
+    with open(sources["curriculum"], "a") as curriculum:
+        curriculum.write("3570120,4,4,0,6.0,3570119|3570100\n")
+    assert load_registries(cache_path, **sources) is False
+    assert 3570120 not in Curriculum.Curriculum_details
+    assert load_registries(cache_path, **sources) is True
+
+
+def test_snapshot_ignores_corrupt_cache(catalog, sources, tmp_path):
+    cache_path = tmp_path / "registries.snapshot"
+    cache_path.write_bytes(b"not a snapshot")
+
+    assert load_registries(str(cache_path), **sources) is False
+    assert load_registries(str(cache_path), **sources) is True
+
+
+def test_snapshot_reparses_sources_changed_while_loading(catalog, sources, tmp_path, monkeypatch):
+    cache_path = str(tmp_path / "registries.snapshot")
+    from_csv = Curriculum.from_csv.__func__
+    edits = []
+
+    def edit_during_parse(cls, file_path, report=None):
+        result = from_csv(cls, file_path, report)
+        if not edits:
+            with open(file_path, "a") as curriculum:
+                curriculum.write("3570120,4,4,0,6.0,3570119\n")
+            edits.append(file_path)
+        return result
+
+    monkeypatch.setattr(Curriculum, "from_csv", classmethod(edit_during_parse))
+    Course.course_details = {}
+    with open(sources["courses"], "a") as courses:
+        courses.write("3570120,CS102,Next Course\n")
+
+    assert load_registries(cache_path, **sources) is False
+    assert 3570120 in Curriculum.Curriculum_details
+    Curriculum.Curriculum_details = {}
+    assert load_registries(cache_path, **sources) is True
+    assert 3570120 in Curriculum.Curriculum_details
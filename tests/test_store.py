@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from store import SQLiteStore
+from transcript import Course, Curriculum, Department, Student
+
+
+@pytest.fixture
+def store(catalog, sources, tmp_path):
+    (tmp_path / "grades.csv").write_text(
+        "student_id,semester,numeric_course_code,grade\n"
+        "2202547,Fall 2023,3570100,A\n"
+        "2202547,Spring 2024,3570119,b+\n"
+        "2202548,Fall 2023,3570100,C\n"
+        "2202548,Fall 2023,3570100,B\n"
+        "2202549,Fall 2023,3570100,Z\n"
+    )
+    with SQLiteStore(str(tmp_path / "registry.db")) as store:
+        assert store.load_departments(sources["departments"]).rows_loaded == 3
+        assert store.load_courses(sources["courses"]).rows_loaded == 2
+        assert store.load_curriculum(sources["curriculum"]).rows_loaded == 2
+        assert store.load_students(sources["students"]).rows_loaded == 60
+        report = store.load_grades(str(tmp_path / "grades.csv"))
+        assert (report.rows_loaded, len(report.errors)) == (4, 1)
+        yield store
+
+
+def test_sql_aggregates_match_in_memory(store):
+    assert store.cgpa(2202547) == round((4.0 * 3 + 3.3 * 5) / 8, 2)
+    assert store.credit_hours(2202547) == 8
+    assert store.semester_gpa(2202547) == {"Fall 2023": 4.0, "Spring 2024": 3.3}
+    assert store.cohort_totals() == {2202547: (3.56, 8), 2202548: (3.0, 3)}
+    assert store.cohort_totals(dept_id=384) == {2202548: (3.0, 3)}
+
+
+def test_attached_store_pages_students_lazily(store):
+    Course.course_details = {}
+    Curriculum.Curriculum_details = {}
+    store.attach()
+
+    assert Curriculum.catalog()[3570119].prerequisite == [3570100]
+    assert Department.department_details[389].dept_name == "Software Engineering"
+    assert len(Student.student_details) == 60
+    assert 2202547 in Student.student_details and 1 not in Student.student_details
+
+    student = Student.student_details[2202547]
+    assert student.cgpa == store.cgpa(2202547)
+    assert student.courses_taken == {"Fall 2023": ((3570100, "A"),), "Spring 2024": ((3570119, "B+"),)}
+
+    student.add_course("Spring 2024", 3570119, "A")
+    assert store.cgpa(2202547) == student.cgpa == 4.0
+
+    pages = list(store.students(dept_id=389, page_size=7).pages())
+    assert [len(page) for page in pages][:2] == [7, 7]
+    assert all(s.dept_id == 389 for page in pages for s in page)
+    assert sum(map(len, pages)) == len(store.students(dept_id=389))
+
+
+def test_stored_student_keys_do_not_materialize(store, monkeypatch):
+    def materialize(rows):
+        raise AssertionError("key iteration built Student objects")
+
+    monkeypatch.setattr(store, "_materialize", materialize)
+    ids = list(store.students(page_size=7))
+    assert len(ids) == 60 and ids == sorted(ids)
+    assert set(store.students(dept_id=389, page_size=7).keys()) < set(ids)
+
+
+def test_stored_students_share_live_objects_across_threads(store, monkeypatch):
+    store.attach()
+    monkeypatch.setattr(Student, "_notify", lambda *args: pytest.fail("materializing notified observers"))
+    first = Student.student_details[2202547]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        looked_up = list(executor.map(Student.student_details.__getitem__, [2202547] * 8))
+        paged = list(executor.submit(lambda: list(store.students(page_size=7).values())).result())
+    assert all(student is first for student in looked_up)
+    assert next(student for student in paged if student.id == 2202547) is first
+    assert store in Student.observers
@@ -0,0 +1,399 @@
+import json
+import os
+import random
+
+import pytest
+
+from transcript import (Course, CourseEnrollmentIndex, Curriculum, Department, Metrics, ProfileTrigger, SemesterKey, Student,
+                        instrumented)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_student(student_id=1, dept_id=389):
+    student = Student(student_id, "John", "Doe", dept_id)
+    student.load_course_list()
+    return student
+
+
+def test_incremental_totals(catalog):
+    student = make_student()
+    student.add_course("Fall 2023", 3580105, "A")
+    student.add_course("Fall 2023", 3600107, "B+")
+    student.add_course("Spring 2024", 3550100, "A")
+
+    assert student.total_credit_hour_taken == 8
+    assert student.calculate_semester_gpa("Fall 2023") == 3.65
+    assert student.calculate_semester_gpa("Spring 2024") == 0.0
+    assert student.calculate_semester_gpa("Fall 2030") is None
+    assert student.calculate_cgpa() == 3.65
+
+
+def test_grade_replacement_adjusts_totals(catalog):
+    student = make_student()
+    student.add_course("Fall 2023", 3580105, "F")
+    student.add_course("Fall 2023", 3600107, "B")
+    student.add_course("Fall 2023", 3580105, "a-")
+
+    assert student.courses_taken["Fall 2023"] == ((3580105, "A-"), (3600107, "B"))
+    assert student.total_credit_hour_taken == 8
+    assert student.cgpa == 3.35
+
+
+def test_running_totals_match_recompute_exactly(catalog, monkeypatch):
+    monkeypatch.setattr(Student, "enforce_prerequisites", False)
+    rng = random.Random(25)
+    codes = list(catalog)
+    for student_id in range(500):
+        student = make_student(student_id)
+        taken = {}
+        for _ in range(rng.randint(1, 12)):
+            semester = rng.choice(["Fall 2023", "Spring 2024", "Fall 2024"])
+            code, grade = rng.choice(codes), rng.choice(Student.GRADES)
+            student.add_course(semester, code, grade)
+            taken[semester, code] = grade
+
+        points = sum(round(Student.GRADE_POINTS[grade] * 10) * catalog[code].credit
+                     for (_, code), grade in taken.items())
+        credits = sum(catalog[code].credit for _, code in taken)
+        assert student.cgpa == (round(points / (credits * 10), 2) if credits else 0.0)
+        assert (student._quality_points, student._credits) == student._compute_totals()[:2]
+
+
+def test_debug_mode_detects_stale_totals(catalog, monkeypatch):
+    monkeypatch.setattr(Student, "debug", True)
+    student = make_student()
+    student.add_course("Fall 2023", 3580105, "B")
+
+    student._credits += 4
+    with pytest.raises(RuntimeError, match="out of sync"):
+        student.calculate_cgpa()
+
+    student.recalculate_totals()
+    assert student.calculate_cgpa() == 3.0
+    assert student.total_credit_hour_taken == 4
+
+
+def test_students_share_read_only_catalog(catalog):
+    first, second = make_student(1), make_student(2)
+
+    assert first.course_curriculum is second.course_curriculum
+    with pytest.raises(TypeError):
+        first.course_curriculum[999] = None
+    assert not first.curriculum_is_stale()
+
+    Curriculum.Curriculum_details = dict(Curriculum.Curriculum_details)
+    assert first.curriculum_is_stale()
+    first.load_course_list()
+    assert not first.curriculum_is_stale()
+    assert second.curriculum_is_stale()
+
+
+def test_grades_from_csv_streams_chunks(catalog, tmp_path):
+    Student.student_details = {1: make_student(1), 2: make_student(2)}
+    grades = tmp_path / "grades.csv"
+    grades.write_text(
+        "Student_ID,Semester,Numeric_Course_Code,Grade\n"
+        "1,Fall 2023,3580105,A\n"
+        "1,Fall 2023,3600107,b+\n"
+        "2,Fall 2023,3580105,C\n"
+        "2,Fall 2023,999,A\n"
+        "3,Fall 2023,3580105,A\n"
+        "1,Spring 2024,3580105,Q\n"
+        "x,Fall 2023,3580105,A\n"
+        "2,Fall 2023,3580105,B\n"
+    )
+
+    chunks = list(Student.iter_grade_records(str(grades), chunk_size=3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert chunks[0][0] == (2, 1, "Fall 2023", 3580105, "A")
+
+    report = Student.grades_from_csv(str(grades), chunk_size=3)
+    assert report.rows_read == 8
+    assert report.rows_loaded == 4
+    assert len(report.errors) == 4
+    assert sorted(line for line, _ in report.errors) == [5, 6, 7, 8]
+
+    first, second = Student.student_details[1], Student.student_details[2]
+    assert first.cgpa == 3.65
+    assert second.courses_taken == {"Fall 2023": ((3580105, "B"),)}
+    assert second.cgpa == 3.0
+
+
+def test_loaders_resolve_shipped_headers(catalog):
+    Department.department_details = {}
+    departments = Department.from_csv(os.path.join(ROOT, "Department.csv"))
+    assert departments[389].dept_name == "Software Engineering"
+    assert len(departments) == 3
+    assert Department.load_report.ok
+
+    students = Student.from_csv(os.path.join(ROOT, "students.csv"))
+    assert students[2202547].fullname() == "Carter Emily"
+    assert students[2202547].dept_id == 355
+    assert Student.load_report.rows_loaded == len(students) == 60
+
+
+def test_curriculum_loader_collects_errors(catalog, tmp_path):
+    Course.course_details = {code: Course(code, f"C{code}", "Course") for code in (3570119, 3570100, 3580105)}
+    path = tmp_path / "curriculum.csv"
+    path.write_text(
+        "Numerical_Code,Credit,Theory,Pratical,ECTS,Prequesite\r\n"
+        "3570119,5,4,2,7.5,3570100\r\n"
+        "3580105,4,3,2,6.5,Null\r\n"
+        "3600107,4,3,2,6.0,Null\r\n"
+        "3570100,x,3,0,5.0,Null\r\n"
+        ",,,,,\r\n"
+    )
+
+    curriculum = Curriculum.from_csv(str(path))
+
+    assert sorted(curriculum) == [3570119, 3580105]
+    assert curriculum[3570119].prerequisite == [3570100]
+    assert curriculum[3580105].prerequisite == []
+    report = Curriculum.load_report
+    assert (report.rows_read, report.rows_loaded) == (4, 2)
+    assert [line for line, _ in report.errors] == [4, 5]
+    assert "Course 3600107 not found" in report.errors[0][1]
+
+
+def test_missing_file_is_reported(catalog, tmp_path):
+    Course.from_csv(str(tmp_path / "missing.csv"))
+    assert Course.load_report.errors == [(0, f"File not found: {tmp_path / 'missing.csv'}")]
+
+
+def test_prerequisite_enforcement(catalog):
+    student = make_student()
+
+    with pytest.raises(ValueError, match="Prerequisite 3570100 not taken"):
+        student.add_course("Fall 2023", 3570119, "A")
+
+    student.add_course("Summer 2023", 3570100, "F")
+    with pytest.raises(ValueError, match="Prerequisite 3570100 not taken"):
+        student.add_course("Fall 2023", 3570119, "A")
+
+    student.add_course("Summer 2023", 3570100, "C")
+    student.add_course("Fall 2023", 3570119, "A")
+    assert len(student.courses_taken["Fall 2023"]) == 1
+
+    rejected = make_student(2).add_courses([("Fall 2023", 3570119, "A"), ("Fall 2023", 3570100, "B")])
+    assert rejected == []
+    rejected = make_student(3).add_courses([("Fall 2023", 3570119, "A"), ("Fall 2023", 3570100, "F")])
+    assert rejected == [(("Fall 2023", 3570119, "A"), "Prerequisite 3570100 not taken")]
+
+    Curriculum.Curriculum_details = dict(catalog)
+    Curriculum.Curriculum_details[3600107] = Curriculum(3600107, 4, 3, 2, 6.0, [3570119])
+    chained = make_student(4)
+    rejected = chained.add_courses([("Fall 2023", 3570119, "A"), ("Fall 2023", 3600107, "A")])
+    assert [record for record, _ in rejected] == [("Fall 2023", 3570119, "A"), ("Fall 2023", 3600107, "A")]
+    assert chained.courses_taken == {}
+    rejected = make_student(5).add_courses([("Fall 2024", 3600107, "A"), ("Fall 2023", 3570119, "B"),
+                                           ("Spring 2023", 3570100, "C")])
+    assert rejected == []
+
+
+def test_prerequisite_graph_closure_and_eligibility(catalog):
+    Curriculum.Curriculum_details = dict(catalog)
+    Curriculum.Curriculum_details[3600107] = Curriculum(3600107, 4, 3, 2, 6.0, [3570119, 3580105, 3580105])
+    Curriculum.catalog()
+    graph = Curriculum.prerequisite_graph
+
+    assert graph.cyclic == []
+    assert sorted(graph.all_prerequisites(3600107)) == [3570100, 3570119, 3580105]
+    assert graph.order.index(3570100) < graph.order.index(3570119) < graph.order.index(3600107)
+
+    fresh, advanced = make_student(1), make_student(2)
+    advanced.add_courses([("Fall 2023", 3570100, "A"), ("Spring 2024", 3570119, "B"), ("Spring 2024", 3580105, "C")])
+
+    assert sorted(fresh.eligible_courses()) == [3550100, 3570100, 3580105]
+    eligible = graph.eligible_by_student([fresh, advanced])
+    assert {student_id: sorted(codes) for student_id, codes in eligible.items()} == {
+        1: [3550100, 3570100, 3580105],
+        2: [3550100, 3600107],
+    }
+
+
+def test_prerequisite_cycles_are_reported(catalog):
+    Curriculum.Curriculum_details = {
+        1: Curriculum(1, 3, 3, 0, 5.0, [2]),
+        2: Curriculum(2, 3, 3, 0, 5.0, [3]),
+        3: Curriculum(3, 3, 3, 0, 5.0, [1]),
+        4: Curriculum(4, 3, 3, 0, 5.0, [3]),
+    }
+    Curriculum.catalog()
+    graph = Curriculum.prerequisite_graph
+
+    assert sorted(graph.cyclic) == [1, 2, 3]
+    assert sorted(graph.all_prerequisites(4)) == [1, 2, 3]
+
+
+def test_compact_student_representation(catalog):
+    student = make_student()
+    student.add_course("Fall 2023", 3580105, "b")
+    student.add_course("Spring 2024", 3600107, "A")
+    student.add_course("Fall 2023", 3570100, "C+")
+
+    assert not hasattr(student, "__dict__")
+    assert student._course_codes.typecode == "I" and student._grade_codes.typecode == "B"
+    assert student.courses_taken == {
+        "Fall 2023": ((3580105, "B"), (3570100, "C+")),
+        "Spring 2024": ((3600107, "A"),),
+    }
+    with pytest.raises(TypeError):
+        student.courses_taken["Fall 2023"] = ()
+    with pytest.raises(AttributeError):
+        student.courses_taken["Fall 2023"].append((3570119, "A"))
+
+    copy = make_student(2)
+    copy.courses_taken = student.courses_taken
+    assert copy.cgpa == student.cgpa == 3.17
+    assert copy.calculate_semester_gpa("Spring 2024") == 4.0
+    assert copy._semesters.tolist() == student._semesters.tolist()
+
+
+def test_semester_key_parsing():
+    assert SemesterKey.parse("Fall 2023") == (2023, 3, "Fall 2023")
+    assert SemesterKey.parse("2024-spring")[:2] == (2024, 1)
+    assert SemesterKey.parse("Summer 2023") < SemesterKey.parse("Fall 2023") < SemesterKey.parse("Spring 2024")
+    with pytest.raises(ValueError):
+        SemesterKey.parse("Term 3")
+    assert SemesterKey.of("Term 3") > SemesterKey.parse("Fall 2099")
+
+
+def test_chronological_timeline(catalog):
+    student = make_student()
+    student.add_course("Spring 2024", 3600107, "C")
+    student.add_course("Fall 2023", 3580105, "A")
+    student.add_course("Summer 2023", 3570100, "B")
+    student.add_course("Fall 2023", 3550100, "A")
+
+    assert student.semester_order() == ["Summer 2023", "Fall 2023", "Spring 2024"]
+    assert student.cgpa_as_of("Spring 2023") == 0.0
+    assert student.cgpa_as_of("Summer 2023") == 3.0
+    assert student.cgpa_as_of("Fall 2023") == 3.57
+    assert student.cgpa_as_of("Spring 2030") == student.cgpa == 3.0
+    assert student.gpa_between("Fall 2023", "Spring 2024") == 3.0
+    assert student.gpa_between("Fall 2024", "Spring 2025") is None
+    with pytest.raises(ValueError, match="Fal 2022"):
+        student.cgpa_as_of("Fal 2022")
+    with pytest.raises(ValueError):
+        student.gpa_between("Fall 2023", "Sprng 2024")
+
+    student.add_course("Fall 2023", 3580105, "C")
+    assert student.cgpa_as_of("Fall 2023") == 2.43
+    assert student.courses_taken["Fall 2023"] == ((3580105, "C"), (3550100, "A"))
+
+
+def test_lazy_student_loading(catalog, tmp_path):
+    path = tmp_path / "students.csv"
+    path.write_text(
+        "Student_id,Firstname,Lastname,Dept_id\n"
+        "30,Emily,Carter,355\n"
+        "10,James,Wilson,384\n"
+        "oops,Bad,Row,1\n"
+        "\n"
+        '20,"Sophia, Jr",Martinez,389\n'
+        "10,Jimmy,Wilson,384\n"
+    )
+
+    with Student.from_csv_lazy(str(path), max_cached=2) as students:
+        assert len(students) == 3
+        assert list(students) == [10, 20, 30]
+        assert students.cached == 0
+        assert len(Student.load_report.errors) == 1
+
+        assert students[20].firstname == "Sophia, Jr"
+        assert students[10].fullname() == "Wilson Jimmy"
+        assert students[20] is students[20]
+        assert students[30].dept_id == 355
+        assert students.cached == 2
+        assert 999 not in students
+        with pytest.raises(KeyError):
+            students[999]
+
+
+def test_lazy_students_skip_malformed_rows_and_pin_changes(catalog, tmp_path):
+    path = tmp_path / "students.csv"
+    path.write_text(
+        "id,firstname,lastname,dept_id\n"
+        "10,James,Wilson,384\n"
+        "20,Sophia,Martinez,389\n"
+        "30,Emily\n"
+        "10,Jimmy,Wilson,cs\n"
+    )
+
+    with Student.from_csv_lazy(str(path), max_cached=1) as students:
+        assert list(students) == [10, 20]
+        assert 30 not in students
+        assert [line for line, _ in students.report.errors] == [4, 5]
+        assert students[10].firstname == "James"
+
+        changed = students[10]
+        changed.load_course_list()
+        changed.add_course("Fall 2023", 3580105, "A")
+        students[20]
+        assert (students.cached, students.pinned) == (1, 1)
+        assert students[10] is changed and students[10].cgpa == 4.0
+
+
+def test_instrumentation_is_scoped(catalog, tmp_path):
+    original = Student.__dict__["add_course"]
+    profiler = ProfileTrigger(str(tmp_path / "profiles"), threshold=0.0, calls=1)
+    with instrumented(Metrics(dump_path=str(tmp_path / "metrics.json"), profiler=profiler)) as metrics:
+        assert Student.__dict__["add_course"] is not original
+        student = Student(1, "Ada", "Lovelace", 389)
+        student.load_course_list()
+        student.add_course("Fall 2023", 3570100, "A")
+        with pytest.raises(ValueError):
+            student.add_course("Fall 2023", 9999999, "A")
+        student.calculate_semester_gpa("Fall 2023")
+
+    assert Student.__dict__["add_course"] is original
+    stats = metrics.snapshot()
+    assert stats["Student.add_course"]["calls"] == 2
+    assert stats["Student.add_course"]["rejected"] == 1
+    assert stats["Student.calculate_cgpa"]["calls"] >= 1
+    assert stats["Student.calculate_semester_gpa"]["calls"] == 1
+    assert profiler.profiles and os.path.exists(profiler.profiles[0])
+    with open(tmp_path / "metrics.json") as dumped:
+        assert json.load(dumped)["stats"]["Student.add_course"]["calls"] == 2
+
+
+def test_instrumentation_counts_rejected_rows(catalog, tmp_path):
+    path = tmp_path / "departments.csv"
+    path.write_text("dept_id,dept_name\n1,Maths\nbad,Physics\n")
+    with instrumented() as metrics:
+        Department.from_csv(str(path))
+    assert metrics.snapshot()["Department.from_csv"]["rejected"] == 1
+
+
+def test_curriculum_delta_reload(catalog, tmp_path):
+    index = CourseEnrollmentIndex.build()
+    enrollments = {1: [(3570100, "A"), (3580105, "B")], 2: [(3600107, "C")], 3: [(3580105, "A")]}
+    for student_id, courses in enrollments.items():
+        student = Student.student_details[student_id] = make_student(student_id)
+        for code, grade in courses:
+            student.add_course("Fall 2023", code, grade)
+    takes_intro, untouched = Student.student_details[1], Student.student_details[3]
+    assert index.students_for([3580105]) == [1, 3]
+
+    path = tmp_path / "curriculum.csv"
+    path.write_text(
+        "numeric_course_code,credit,theory,practical,ects,prerequisite\n"
+        "3570100,4,3,0,5.0,Null\n"
+        "3570119,5,4,2,7.5,3570100\n"
+        "3580105,4,3,2,6.0,Null\n"
+        "3600107,4,3,2,6.0,Null\n"
+        "3550100,0,2,0,1.0,Null\n"
+    )
+    old_entry = Curriculum.Curriculum_details[3600107]
+    delta = Curriculum.reload_csv(str(path), index)
+
+    assert delta.applied and not delta.added and not delta.removed
+    assert delta.changed == {3570100: {"credit": (3, 4)}, 3580105: {"ects": (6.5, 6.0)}}
+    assert delta.recalculated == [1]
+    assert Curriculum.Curriculum_details[3600107] is old_entry
+    assert takes_intro.total_credit_hour_taken == 8 and takes_intro.cgpa == 3.5
+    takes_intro._verify_totals()
+    assert not untouched.curriculum_is_stale()
+
+    assert Curriculum.reload_csv(str(path), index).empty
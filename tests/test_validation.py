@@ -0,0 +1,34 @@
+from transcript import Course, Curriculum, Student
+from validation import validate_registries
+
+
+def test_bulk_reference_validation(catalog, tmp_path):
+    Curriculum.Curriculum_details = {**catalog, 3999999: Curriculum(3999999, 3, 3, 0, 5.0, [3888888])}
+    Curriculum.catalog()
+    for student_id, dept_id in ((1, 389), (2, 999), (3, 999)):
+        student = Student.student_details[student_id] = Student(student_id, "First", "Last", dept_id)
+        student.load_course_list()
+        student.add_course("Fall 2023", 3580105, "A")
+    del Course.course_details[3580105]
+
+    grades = tmp_path / "grades.csv"
+    grades.write_text(
+        "student_id,semester,numeric_course_code,grade\n"
+        "1,Fall 2023,3570100,A\n"
+        "4,Fall 2023,3570100,B\n"
+        "4,Fall 2023,3777777,B\n"
+        "x,Fall 2023,3570100,B\n"
+    )
+    report = validate_registries(grades_path=str(grades), sample_size=1)
+
+    assert not report.ok
+    checks = report.as_dict()["checks"]
+    assert checks["curriculum.course"]["samples"] == [3580105]
+    assert checks["curriculum.prerequisite"]["missing_keys"] == 1
+    assert checks["student.department"] == {"keys_checked": 2, "rows_checked": 3, "missing_keys": 1,
+                                             "rows_affected": 2, "samples": [999]}
+    assert checks["enrollment.course"]["rows_affected"] == 3
+    assert checks["enrollment.curriculum"]["missing_keys"] == 0
+    assert checks["grades.student"]["rows_affected"] == 2
+    assert checks["grades.course"]["samples"] == [3777777]
+    assert report.load_reports[-1].errors[0][0] == 5
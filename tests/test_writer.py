@@ -0,0 +1,82 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from batch import generate_transcripts, render_transcript
+from transcript import Course, Student
+from writer import Layout, TranscriptWriter, write_transcripts
+
+
+def make_students():
+    Course.course_details = dict(Course.course_details)
+    Course.course_details[3580105] = Course(3580105, "CS102", 'Data Structures, "Advanced" & <Lab>')
+    students = []
+    for student_id, grades in ((1, ("A", "B")), (2, ("C", "F"))):
+        student = Student(student_id, f"First{student_id}", "Last", 389)
+        student.load_course_list()
+        student.add_course("Fall 2023", 3580105, grades[0])
+        student.add_course("Spring 2024", 3600107, grades[1])
+        students.append(student)
+    return students
+
+
+def test_text_layout_streams_to_gzip(catalog, tmp_path):
+    students = make_students()
+    path = str(tmp_path / "transcripts.txt.gz")
+    stats = write_transcripts(path, students)
+
+    with gzip.open(path, "rt", encoding="utf-8") as source:
+        assert source.read() == "".join(render_transcript(student) for student in students)
+    assert stats.transcripts == 2 and stats.compressed_bytes > 0
+    assert stats.bytes == len("".join(map(render_transcript, students)).encode("utf-8"))
+
+
+def test_structured_layouts(catalog):
+    students = make_students()
+
+    stream = io.BytesIO()
+    with TranscriptWriter(stream, "csv") as writer:
+        writer.write_all(students)
+    rows = list(csv.DictReader(io.StringIO(stream.getvalue().decode("utf-8"))))
+    assert len(rows) == 4
+    assert rows[0]["course_name"] == 'Data Structures, "Advanced" & <Lab>'
+    assert (rows[3]["grade"], rows[3]["semester_gpa"], rows[3]["cgpa"]) == ("F", "0.00", "1.00")
+
+    stream = io.BytesIO()
+    write_transcripts(stream, students, "jsonl")
+    records = [json.loads(line) for line in stream.getvalue().decode("utf-8").splitlines()]
+    assert records[0]["cgpa"] == 3.5 and records[0]["department"] == "Software Engineering"
+    assert records[0]["semesters"][0]["courses"][0] == {
+        "numeric_course_code": 3580105, "course_code": "CS102",
+        "course_name": 'Data Structures, "Advanced" & <Lab>', "credit": 4, "grade": "A",
+    }
+
+    stream = io.BytesIO()
+    write_transcripts(stream, students, "html")
+    page = stream.getvalue().decode("utf-8")
+    assert page.startswith("<!DOCTYPE html>") and page.endswith("</body></html>\n")
+    assert "Data Structures, &quot;Advanced&quot; &amp; &lt;Lab&gt;" in page
+    assert page.count('<section class="transcript">') == 2
+
+    with pytest.raises(ValueError):
+        TranscriptWriter(io.BytesIO(), "pdf")
+
+
+def test_generate_transcripts_in_other_layouts(catalog, tmp_path):
+    students = make_students()
+    written = generate_transcripts(str(tmp_path), students, max_workers=1, layout="jsonl", compress=True)
+    assert written == {389: 2}
+    with gzip.open(tmp_path / "transcripts_389.jsonl.gz", "rt", encoding="utf-8") as source:
+        assert [json.loads(line)["id"] for line in source] == [1, 2]
+
+
+def test_layouts_must_implement_render():
+    class Partial(Layout):
+        def compile_course(self, numeric_course_code, course):
+            return numeric_course_code
+
+    with pytest.raises(TypeError):
+        Partial()
@@ -1,5 +1,328 @@
+import cProfile
 import csv
-from typing import Dict, List, Optional, Tuple
+import json
+import mmap
+import os
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import (Any, Callable, Dict, Generic, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence,
+                    Tuple, TypeVar, Union)
+
+_EMPTY_CATALOG: Mapping[int, 'Curriculum'] = MappingProxyType({})
+
+HEADER_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'id': ('student_id',),
+    'numeric_course_code': ('numerical_code', 'course_number'),
+    'practical': ('pratical',),
+    'prerequisite': ('prequesite', 'prerequisites'),
+}
+
+NULL_VALUES = frozenset({'', 'null', 'none'})
+
+Schema = Sequence[Tuple[str, Callable[[str], Any]]]
+
+GradeChange = Tuple[str, int, Optional[str], Optional[str]]
+
+V = TypeVar('V')
+
+
+class LoadReport:
+    def __init__(self, source: str):
+        self.source = source
+        self.rows_read = 0
+        self.rows_loaded = 0
+        self.errors: List[Tuple[int, str]] = []
+
+    def add_error(self, line: int, message: str) -> None:
+        self.errors.append((line, message))
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return (f"LoadReport(source={self.source!r}, rows_read={self.rows_read}, "
+                f"rows_loaded={self.rows_loaded}, errors={len(self.errors)})")
+
+
+def _normalize_column(name: str) -> str:
+    return name.strip().lower().replace(' ', '_')
+
+
+def _code_list(value: str) -> List[int]:
+    value = value.strip()
+    if value.lower() in NULL_VALUES:
+        return []
+    return [int(code) for code in value.split('|')]
+
+
+def resolve_columns(header: Sequence[str], names: Sequence[str],
+                    aliases: Mapping[str, Tuple[str, ...]] = HEADER_ALIASES) -> List[int]:
+    positions = {_normalize_column(column): idx for idx, column in enumerate(header)}
+    indexes = []
+    for name in names:
+        for candidate in (name,) + tuple(aliases.get(name, ())):
+            if candidate in positions:
+                indexes.append(positions[candidate])
+                break
+        else:
+            raise KeyError(name)
+    return indexes
+
+
+def compile_row_parser(indexes: Sequence[int], converters: Sequence[Callable[[str], Any]]) -> Callable[[List[str]], tuple]:
+    fields = tuple(zip(indexes, converters))
+
+    def parse(row: List[str]) -> tuple:
+        return tuple([convert(row[idx]) for idx, convert in fields])
+    return parse
+
+
+def read_csv_rows(file_path: str, schema: Schema, report: LoadReport,
+                  aliases: Mapping[str, Tuple[str, ...]] = HEADER_ALIASES) -> Iterator[Tuple[int, tuple]]:
+    try:
+        csvfile = open(file_path, newline='', encoding='utf-8')
+    except FileNotFoundError:
+        report.add_error(0, f"File not found: {file_path}")
+        return
+
+    with csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        try:
+            indexes = resolve_columns(header, [name for name, _ in schema], aliases)
+        except KeyError as e:
+            report.add_error(1, f"Missing column {e} in header {header}")
+            return
+
+        parse = compile_row_parser(indexes, [convert for _, convert in schema])
+        for row in reader:
+            if not row:
+                continue
+            try:
+                values = parse(row)
+            except (IndexError, ValueError) as e:
+                if any(field.strip() for field in row):
+                    report.rows_read += 1
+                    report.add_error(reader.line_num, f"Error processing row {row}: {e}")
+                continue
+            report.rows_read += 1
+            yield reader.line_num, values
+
+
+class SemesterKey(NamedTuple):
+    year: int
+    term: int
+    label: str
+
+    TERMS = {'winter': 0, 'spring': 1, 'summer': 2, 'fall': 3, 'autumn': 3}
+    PATTERN = re.compile(r'^\s*(?:([A-Za-z]+)[\s_/-]*(\d{4})|(\d{4})[\s_/-]*([A-Za-z]+))\s*$')
+
+    @classmethod
+    def parse(cls, label: str) -> 'SemesterKey':
+        match = cls.PATTERN.match(label)
+        if match is None:
+            raise ValueError(f"Unrecognised semester '{label}'")
+        term = (match.group(1) or match.group(4)).lower()
+        if term not in cls.TERMS:
+            raise ValueError(f"Unrecognised term '{term}' in semester '{label}'")
+        return cls(int(match.group(2) or match.group(3)), cls.TERMS[term], label)
+
+    @classmethod
+    def of(cls, semester: Union[str, 'SemesterKey']) -> 'SemesterKey':
+        if isinstance(semester, SemesterKey):
+            return semester
+        try:
+            return cls.parse(semester)
+        except ValueError:
+            return cls(9999, len(cls.TERMS), semester)
+
+
+class PrerequisiteGraph:
+    def __init__(self, curriculum: Mapping[int, 'Curriculum']):
+        self.codes: List[int] = list(curriculum)
+        self.index: Dict[int, int] = {code: idx for idx, code in enumerate(self.codes)}
+        for entry in curriculum.values():
+            for code in entry.prerequisite:
+                if code not in self.index:
+                    self.index[code] = len(self.codes)
+                    self.codes.append(code)
+        self.curriculum_mask = (1 << len(curriculum)) - 1
+
+        self.direct: List[int] = [0] * len(self.codes)
+        dependents: List[List[int]] = [[] for _ in self.codes]
+        for entry in curriculum.values():
+            course_id = self.index[entry.numeric_course_code]
+            for code in entry.prerequisite:
+                prerequisite_id = self.index[code]
+                if not self.direct[course_id] >> prerequisite_id & 1:
+                    self.direct[course_id] |= 1 << prerequisite_id
+                    dependents[prerequisite_id].append(course_id)
+
+        pending = [bin(mask).count('1') for mask in self.direct]
+        ready = [course_id for course_id, count in enumerate(pending) if count == 0]
+        order: List[int] = []
+        while ready:
+            course_id = ready.pop()
+            order.append(course_id)
+            for dependent in dependents[course_id]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+        self.order: List[int] = [self.codes[course_id] for course_id in order]
+
+        self.closure: List[int] = list(self.direct)
+        for course_id in order:
+            closure = self.direct[course_id]
+            for prerequisite_id in self._ids(self.direct[course_id]):
+                closure |= self.closure[prerequisite_id]
+            self.closure[course_id] = closure
+
+        blocked = [course_id for course_id, count in enumerate(pending) if count]
+        changed = bool(blocked)
+        while changed:
+            changed = False
+            for course_id in blocked:
+                closure = self.closure[course_id]
+                for prerequisite_id in self._ids(closure):
+                    closure |= self.closure[prerequisite_id]
+                if closure != self.closure[course_id]:
+                    self.closure[course_id] = closure
+                    changed = True
+        self.cyclic: List[int] = [self.codes[course_id] for course_id in blocked
+                                  if self.closure[course_id] >> course_id & 1]
+
+    @staticmethod
+    def _ids(mask: int) -> Iterator[int]:
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def mask(self, codes: Iterable[int]) -> int:
+        mask = 0
+        for code in codes:
+            course_id = self.index.get(code)
+            if course_id is not None:
+                mask |= 1 << course_id
+        return mask
+
+    def codes_in(self, mask: int) -> List[int]:
+        return [self.codes[course_id] for course_id in self._ids(mask)]
+
+    def all_prerequisites(self, numeric_course_code: int) -> List[int]:
+        course_id = self.index.get(numeric_course_code)
+        return [] if course_id is None else self.codes_in(self.closure[course_id])
+
+    def missing_prerequisites(self, numeric_course_code: int, passed_mask: int) -> List[int]:
+        course_id = self.index.get(numeric_course_code)
+        if course_id is None:
+            return []
+        return self.codes_in(self.direct[course_id] & ~passed_mask)
+
+    def eligible_mask(self, passed_mask: int) -> int:
+        eligible = 0
+        for course_id in self._ids(self.curriculum_mask & ~passed_mask):
+            if not self.direct[course_id] & ~passed_mask:
+                eligible |= 1 << course_id
+        return eligible
+
+    def eligible_by_student(self, students: Iterable['Student']) -> Dict[int, List[int]]:
+        by_mask: Dict[int, List[int]] = {}
+        eligible: Dict[int, List[int]] = {}
+        for student in students:
+            passed_mask = student.passed_mask()
+            if passed_mask not in by_mask:
+                by_mask[passed_mask] = self.codes_in(self.eligible_mask(passed_mask))
+            eligible[student.id] = by_mask[passed_mask]
+        return eligible
+
+
+class LockStripes:
+    def __init__(self, stripes: int = 64):
+        self.locks = [threading.RLock() for _ in range(stripes)]
+
+    def __call__(self, key: Any) -> threading.RLock:
+        return self.locks[hash(key) % len(self.locks)]
+
+    def __len__(self) -> int:
+        return len(self.locks)
+
+
+class ShardedRegistry(MutableMapping, Generic[V]):
+    def __init__(self, shards: int = 64, items: Optional[Mapping[Any, V]] = None):
+        self.locks = LockStripes(shards)
+        self._shards: List[Dict[Any, V]] = [{} for _ in range(shards)]
+        if items:
+            for key, value in items.items():
+                self[key] = value
+
+    def _shard(self, key: Any) -> Dict[Any, V]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def __getitem__(self, key: Any) -> V:
+        return self._shard(key)[key]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._shard(key).get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._shard(key)
+
+    def __setitem__(self, key: Any, value: V) -> None:
+        with self.locks(key):
+            self._shard(key)[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        with self.locks(key):
+            del self._shard(key)[key]
+
+    def setdefault(self, key: Any, default: V = None) -> V:
+        with self.locks(key):
+            return self._shard(key).setdefault(key, default)
+
+    def __iter__(self) -> Iterator[Any]:
+        for shard in self._shards:
+            yield from list(shard)
+
+    def __len__(self) -> int:
+        return sum(map(len, self._shards))
+
+
+def _synchronized(method: Callable) -> Callable:
+    def wrapper(self, *args, **kwargs):
+        locks = self.locks
+        if locks is None:
+            return method(self, *args, **kwargs)
+        with locks(self.id):
+            return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__qualname__ = method.__qualname__
+    wrapper.__wrapped__ = method
+    return wrapper
+
+
+class StudentObserver:
+    def student_updated(self, student: 'Student', changes: List[GradeChange], old_cgpa: float) -> None:
+        pass
+
+    def attach(self) -> 'StudentObserver':
+        if self not in Student.observers:
+            Student.observers.append(self)
+        return self
+
+    def detach(self) -> None:
+        if self in Student.observers:
+            Student.observers.remove(self)
+
 
 class Student:
     student_details: Dict[int, 'Student'] = {}
@@ -18,66 +341,267 @@ class Student:
         'F': 0.0
     }
 
+    CSV_SCHEMA: Schema = (('id', int), ('firstname', str.strip), ('lastname', str.strip), ('dept_id', int))
+    GRADE_SCHEMA: Schema = (('student_id', int), ('semester', str.strip), ('numeric_course_code', int), ('grade', str.strip))
+    load_report: Optional[LoadReport] = None
+
+    GRADES: Tuple[str, ...] = tuple(GRADE_POINTS)
+    GRADE_CODES: Dict[str, int] = dict(zip(GRADES, range(len(GRADES))))
+    _GRADE_POINT_TABLE: Tuple[float, ...] = tuple(GRADE_POINTS.values())
+    # Grade points have one decimal place, so quality points are kept as exact
+    # integers in tenths and only divided when a GPA is read.
+    _QP_SCALE = 10
+    _GRADE_POINT_UNITS: Tuple[int, ...] = ()
+
+    FAILING_GRADES = frozenset({'F'})
+    _FAILING_CODES = frozenset(map(GRADE_CODES.__getitem__, FAILING_GRADES))
+
+    _semester_names: List[str] = []
+    _semester_keys: List[SemesterKey] = []
+    _semester_ids: Dict[str, int] = {}
+
+    debug: bool = False
+    enforce_prerequisites: bool = True
+    observers: List[StudentObserver] = []
+    grading_schemes: Tuple['GradingScheme', ...] = ()
+    locks: Optional[LockStripes] = None
+    _intern_lock = threading.Lock()
+
+    __slots__ = (
+        'id', 'firstname', 'lastname', 'dept_id', 'course_curriculum', 'curriculum_version',
+        'total_credit_hour_taken', 'cgpa', '_quality_points', '_credits',
+        '_semesters', '_semester_qp', '_semester_credits',
+        '_semester_slots', '_course_codes', '_grade_codes',
+        '_enrollment_keys', '_enrollment_positions', '_timeline',
+        '_passed_mask', '_passed_graph', '__weakref__'
+    )
+
     def __init__(self, id: int, firstname: str, lastname: str, dept_id: int):
         self.id = id
         self.firstname = firstname
         self.lastname = lastname
         self.dept_id = dept_id
-        self.course_curriculum: Dict[int, 'Curriculum'] = {}
-        self.courses_taken: Dict[str, List[Tuple[int, str]]] = {}
+        self.course_curriculum: Mapping[int, 'Curriculum'] = _EMPTY_CATALOG
+        self.curriculum_version: int = 0
         self.total_credit_hour_taken: int = 0
         self.cgpa: float = 0.0
+        self._quality_points: int = 0
+        self._credits: int = 0
+        self._semesters = array('H')
+        self._semester_qp = array('q')
+        self._semester_credits = array('I')
+        self._semester_slots = array('H')
+        self._course_codes = array('I')
+        self._grade_codes = array('B')
+        self._enrollment_keys = array('Q')
+        self._enrollment_positions = array('H')
+        self._timeline: Optional[Tuple[List[Tuple[int, int]], List[int], array, array]] = None
+        self._passed_mask: int = 0
+        self._passed_graph: Optional[PrerequisiteGraph] = None
 
     def fullname(self) -> str:
         return f'{self.lastname} {self.firstname}'
 
     @classmethod
-    def from_csv(cls, file_path: str) -> Dict[int, 'Student']:
-        try:
-            with open(file_path, newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    try:
-                        student = cls(
-                            id=int(row['id']),
-                            firstname=row['firstname'],
-                            lastname=row['lastname'],
-                            dept_id=int(row['dept_id'])
-                        )
-                        cls.student_details[student.id] = student
-                    except (KeyError, ValueError) as e:
-                        print(f"Error processing row {row}: {e}")
-        except FileNotFoundError:
-            print(f"File not found: {file_path}")
+    def from_csv(cls, file_path: str, report: Optional[LoadReport] = None) -> Dict[int, 'Student']:
+        cls.load_report = report = report or LoadReport(file_path)
+        for _, (student_id, firstname, lastname, dept_id) in read_csv_rows(file_path, cls.CSV_SCHEMA, report):
+            cls.student_details[student_id] = cls(student_id, firstname, lastname, dept_id)
+            report.rows_loaded += 1
         return cls.student_details
 
+    @classmethod
+    def from_csv_lazy(cls, file_path: str, max_cached: int = 1024,
+                      report: Optional[LoadReport] = None) -> 'LazyStudents':
+        cls.load_report = report = report or LoadReport(file_path)
+        return LazyStudents(file_path, cls, max_cached, report)
+
+    @classmethod
+    def iter_grade_records(cls, file_path: str, chunk_size: int = 10000,
+                           report: Optional[LoadReport] = None) -> Iterator[List[Tuple[int, int, str, int, str]]]:
+        if report is None:
+            report = LoadReport(file_path)
+
+        chunk: List[Tuple[int, int, str, int, str]] = []
+        for line_num, record in read_csv_rows(file_path, cls.GRADE_SCHEMA, report):
+            chunk.append((line_num,) + record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @classmethod
+    def grades_from_csv(cls, file_path: str, chunk_size: int = 10000) -> LoadReport:
+        report = LoadReport(file_path)
+        for chunk in cls.iter_grade_records(file_path, chunk_size, report):
+            by_student: Dict[int, Tuple[List[int], List[Tuple[str, int, str]]]] = {}
+            for line_num, student_id, semester, numeric_course_code, grade in chunk:
+                lines, records = by_student.setdefault(student_id, ([], []))
+                lines.append(line_num)
+                records.append((semester, numeric_course_code, grade))
+
+            for student_id, (lines, records) in by_student.items():
+                student = cls.student_details.get(student_id)
+                if student is None:
+                    for line_num in lines:
+                        report.add_error(line_num, f"Student {student_id} not found")
+                    continue
+                rejected = student._add_courses(records)
+                report.rows_loaded += len(records) - len(rejected)
+                for idx, message in sorted(rejected):
+                    report.add_error(lines[idx], f"Student {student_id} {records[idx]}: {message}")
+        return report
+
+    @classmethod
+    def use_sharded_registry(cls, shards: int = 64) -> ShardedRegistry:
+        registry: ShardedRegistry = ShardedRegistry(shards, cls.student_details)
+        cls.locks = registry.locks
+        cls.student_details = registry
+        return registry
+
+    @_synchronized
     def load_course_list(self) -> None:
-        self.course_curriculum = {
-            numeric_course_code: curriculum 
-            for numeric_course_code, curriculum in Curriculum.Curriculum_details.items()
-        }
+        published = Curriculum.published()
+        self.course_curriculum = published.catalog
+        self.curriculum_version = published.version
+
+    def curriculum_is_stale(self) -> bool:
+        return self.curriculum_version != Curriculum.published().version
+
+    @classmethod
+    def _intern_semester(cls, semester: str) -> int:
+        code = cls._semester_ids.get(semester)
+        if code is None:
+            with cls._intern_lock:
+                code = cls._semester_ids.get(semester)
+                if code is None:
+                    cls._semester_names.append(semester)
+                    cls._semester_keys.append(SemesterKey.of(semester))
+                    code = cls._semester_ids[semester] = len(cls._semester_names) - 1
+        return code
+
+    def _semester_slot(self, semester: str, create: bool = False) -> Optional[int]:
+        code = self._intern_semester(semester) if create else self._semester_ids.get(semester)
+        if code is None:
+            return None
+        try:
+            return self._semesters.index(code)
+        except ValueError:
+            if not create:
+                return None
+        self._semesters.append(code)
+        self._semester_qp.append(0)
+        self._semester_credits.append(0)
+        return len(self._semesters) - 1
+
+    def _find_enrollment(self, slot: int, numeric_course_code: int) -> Optional[int]:
+        key = slot << 32 | numeric_course_code
+        idx = bisect_left(self._enrollment_keys, key)
+        if idx < len(self._enrollment_keys) and self._enrollment_keys[idx] == key:
+            return self._enrollment_positions[idx]
+        return None
 
+    def _append_enrollment(self, slot: int, numeric_course_code: int, grade_code: int) -> None:
+        key = slot << 32 | numeric_course_code
+        idx = bisect_left(self._enrollment_keys, key)
+        self._enrollment_keys.insert(idx, key)
+        self._enrollment_positions.insert(idx, len(self._course_codes))
+        self._semester_slots.append(slot)
+        self._course_codes.append(numeric_course_code)
+        self._grade_codes.append(grade_code)
+
+    @property
+    def courses_taken(self) -> Mapping[str, Tuple[Tuple[int, str], ...]]:
+        names = [self._semester_names[code] for code in self._semesters]
+        courses: List[List[Tuple[int, str]]] = [[] for _ in names]
+        for slot, numeric_course_code, grade_code in zip(self._semester_slots, self._course_codes, self._grade_codes):
+            courses[slot].append((numeric_course_code, self.GRADES[grade_code]))
+        return MappingProxyType({name: tuple(rows) for name, rows in zip(names, courses)})
+
+    @courses_taken.setter
+    @_synchronized
+    def courses_taken(self, courses_taken: Mapping[str, Iterable[Tuple[int, str]]]) -> None:
+        old_cgpa = self.cgpa
+        removed = self._enrollment_changes(removed=True) if self.observers else []
+        self._load_courses(courses_taken)
+        if self.observers:
+            self._notify(removed + self._enrollment_changes(removed=False), old_cgpa)
+
+    def _load_courses(self, courses_taken: Mapping[str, Iterable[Tuple[int, str]]]) -> None:
+        self._semesters = array('H')
+        self._semester_qp = array('q')
+        self._semester_credits = array('I')
+        self._course_codes = array('I')
+        self._grade_codes = array('B')
+        self._semester_slots = array('H')
+        self._enrollment_keys = array('Q')
+        self._enrollment_positions = array('H')
+        for semester, courses in courses_taken.items():
+            courses = list(courses)
+            if not courses:
+                continue
+            slot = self._semester_slot(semester, create=True)
+            for numeric_course_code, grade in courses:
+                grade_code = self.GRADE_CODES.get(grade.upper())
+                if grade_code is None:
+                    raise ValueError(f"Invalid grade '{grade}'. Must be one of: {list(self.GRADE_POINTS.keys())}")
+                self._record_grade(slot, numeric_course_code, grade_code)
+        self._passed_graph = None
+        self._recalculate()
+
+    def _enrollment_changes(self, removed: bool) -> List[GradeChange]:
+        changes: List[GradeChange] = []
+        for slot, numeric_course_code, grade_code in zip(self._semester_slots, self._course_codes, self._grade_codes):
+            semester = self._semester_names[self._semesters[slot]]
+            grade = self.GRADES[grade_code]
+            changes.append((semester, numeric_course_code, grade, None) if removed
+                           else (semester, numeric_course_code, None, grade))
+        return changes
+
+    def _record_grade(self, slot: int, numeric_course_code: int, grade_code: int) -> Optional[int]:
+        position = self._find_enrollment(slot, numeric_course_code)
+        if position is None:
+            self._append_enrollment(slot, numeric_course_code, grade_code)
+            return None
+        old_grade_code = self._grade_codes[position]
+        self._grade_codes[position] = grade_code
+        return old_grade_code
+
+    def _notify(self, changes: List[GradeChange], old_cgpa: float) -> None:
+        # Runs on the writer's thread holding only this student's lock; observers
+        # that share state across students must lock it themselves.
+        for observer in self.observers:
+            observer.student_updated(self, changes, old_cgpa)
+
+    @_synchronized
     def add_course(self, semester: str, numeric_course_code: int, grade: str) -> None:
         try:
             if numeric_course_code not in self.course_curriculum:
                 raise ValueError(f"Course {numeric_course_code} not found in curriculum")
-            
-            if grade.upper() not in self.GRADE_POINTS:
+
+            grade = grade.upper()
+            grade_code = self.GRADE_CODES.get(grade)
+            if grade_code is None:
                 raise ValueError(f"Invalid grade '{grade}'. Must be one of: {list(self.GRADE_POINTS.keys())}")
-            
-            if semester not in self.courses_taken:
-                self.courses_taken[semester] = []
-            
-            for idx, (existing_code, _) in enumerate(self.courses_taken[semester]):
-                if existing_code == numeric_course_code:
-                    self.courses_taken[semester][idx] = (numeric_course_code, grade.upper())
-                    break
-            else:
-                self.courses_taken[semester].append((numeric_course_code, grade.upper()))
-            
+
+            if self.enforce_prerequisites:
+                missing = Curriculum.prerequisite_graph.missing_prerequisites(numeric_course_code, self.passed_mask())
+                if missing:
+                    raise ValueError(f"Prerequisite {missing[0]} not taken")
+
+            old_cgpa = self.cgpa
+            slot = self._semester_slot(semester, create=True)
+            old_grade_code = self._record_grade(slot, numeric_course_code, grade_code)
+            self._apply_grade_delta(slot, numeric_course_code, old_grade_code, grade_code)
+            self._update_passed(numeric_course_code, old_grade_code, grade_code)
             self.update_credit_hours()
             self.calculate_cgpa()
-            
+
+            if self.observers:
+                old_grade = None if old_grade_code is None else self.GRADES[old_grade_code]
+                self._notify([(semester, numeric_course_code, old_grade, grade)], old_cgpa)
+
         except ValueError as e:
             print(f"Error adding course: {e}")
             raise
@@ -85,116 +609,547 @@ class Student:
             print(f"Unexpected error adding course: {e}")
             raise
 
-    def calculate_semester_gpa(self, semester: str) -> Optional[float]:
-        if semester not in self.courses_taken or not self.courses_taken[semester]:
-            return None
-
-        total_quality_points = 0.0
-        total_credits = 0
+    def add_courses(self, records: Iterable[Tuple[str, int, str]]) -> List[Tuple[Tuple[str, int, str], str]]:
+        records = list(records)
+        return [(records[idx], message) for idx, message in self._add_courses(records)]
 
-        for numeric_course_code, grade in self.courses_taken[semester]:
+    @_synchronized
+    def _add_courses(self, records: Sequence[Tuple[str, int, str]]) -> List[Tuple[int, str]]:
+        rejected: List[Tuple[int, str]] = []
+        accepted: List[Tuple[str, int, str]] = []
+        positions: List[int] = []
+        for position, (semester, numeric_course_code, grade) in enumerate(records):
+            grade = grade.upper()
             if numeric_course_code not in self.course_curriculum:
+                rejected.append((position, f"Course {numeric_course_code} not found in curriculum"))
+            elif grade not in self.GRADE_CODES:
+                rejected.append((position, f"Invalid grade '{grade}'"))
+            else:
+                accepted.append((semester, numeric_course_code, grade))
+                positions.append(position)
+
+        if self.enforce_prerequisites and accepted:
+            # Like add_course, prerequisites are checked against courses passed in any
+            # semester, including ones later than the course being added.
+            graph = Curriculum.prerequisite_graph
+            passed_mask = self.passed_mask()
+            pending = list(range(len(accepted)))
+            admitted: List[int] = []
+            progress = True
+            while pending and progress:
+                progress = False
+                waiting = []
+                for idx in pending:
+                    _, numeric_course_code, grade = accepted[idx]
+                    if graph.missing_prerequisites(numeric_course_code, passed_mask):
+                        waiting.append(idx)
+                        continue
+                    admitted.append(idx)
+                    progress = True
+                    if grade not in self.FAILING_GRADES:
+                        passed_mask |= graph.mask((numeric_course_code,))
+                pending = waiting
+            for idx in pending:
+                missing = graph.missing_prerequisites(accepted[idx][1], passed_mask)
+                rejected.append((positions[idx], f"Prerequisite {missing[0]} not taken"))
+            accepted = [accepted[idx] for idx in sorted(admitted)]
+
+        if not accepted:
+            return rejected
+
+        old_cgpa = self.cgpa
+        changes: List[GradeChange] = []
+        for semester, numeric_course_code, grade in accepted:
+            slot = self._semester_slot(semester, create=True)
+            grade_code = self.GRADE_CODES[grade]
+            old_grade_code = self._record_grade(slot, numeric_course_code, grade_code)
+            self._apply_grade_delta(slot, numeric_course_code, old_grade_code, grade_code)
+            self._update_passed(numeric_course_code, old_grade_code, grade_code)
+            changes.append((semester, numeric_course_code,
+                            None if old_grade_code is None else self.GRADES[old_grade_code], grade))
+
+        self.update_credit_hours()
+        self.calculate_cgpa()
+        if self.observers:
+            self._notify(changes, old_cgpa)
+        return rejected
+
+    def passed_mask(self) -> int:
+        graph = Curriculum.prerequisite_graph
+        if self._passed_graph is not graph:
+            failing = self._FAILING_CODES
+            self._passed_graph = graph
+            self._passed_mask = graph.mask(
+                numeric_course_code
+                for numeric_course_code, grade_code in zip(self._course_codes, self._grade_codes)
+                if grade_code not in failing
+            )
+        return self._passed_mask
+
+    def _update_passed(self, numeric_course_code: int, old_grade_code: Optional[int], new_grade_code: int) -> None:
+        if self._passed_graph is not Curriculum.prerequisite_graph:
+            return
+        if new_grade_code not in self._FAILING_CODES:
+            self._passed_mask |= self._passed_graph.mask((numeric_course_code,))
+        elif old_grade_code is not None and old_grade_code not in self._FAILING_CODES:
+            self._passed_graph = None
+
+    def eligible_courses(self) -> List[int]:
+        graph = Curriculum.prerequisite_graph
+        return graph.codes_in(graph.eligible_mask(self.passed_mask()))
+
+    def _apply_grade_delta(self, slot: int, numeric_course_code: int,
+                           old_grade_code: Optional[int], new_grade_code: int) -> None:
+        credit = self.course_curriculum[numeric_course_code].credit
+        quality_points = self._GRADE_POINT_UNITS[new_grade_code] * credit
+        credits = credit
+        if old_grade_code is not None:
+            quality_points -= self._GRADE_POINT_UNITS[old_grade_code] * credit
+            credits = 0
+
+        self._quality_points += quality_points
+        self._credits += credits
+        self._semester_qp[slot] += quality_points
+        self._semester_credits[slot] += credits
+        self._timeline = None
+
+    def _compute_totals(self) -> Tuple[int, int, List[int], List[int]]:
+        semester_qp = [0] * len(self._semesters)
+        semester_credits = [0] * len(self._semesters)
+        for slot, numeric_course_code, grade_code in zip(self._semester_slots, self._course_codes, self._grade_codes):
+            curriculum = self.course_curriculum.get(numeric_course_code)
+            if curriculum is None:
                 continue
+            semester_qp[slot] += self._GRADE_POINT_UNITS[grade_code] * curriculum.credit
+            semester_credits[slot] += curriculum.credit
+        return sum(semester_qp), sum(semester_credits), semester_qp, semester_credits
 
-            curriculum = self.course_curriculum[numeric_course_code]
-            credit = curriculum.credit
-            grade_point = self.GRADE_POINTS.get(grade.upper(), 0.0)
+    def _verify_totals(self) -> None:
+        quality_points, credits, semester_qp, semester_credits = self._compute_totals()
+        if (quality_points, credits) != (self._quality_points, self._credits):
+            raise RuntimeError(
+                f"Cached totals for student {self.id} out of sync: "
+                f"cached ({self._quality_points}, {self._credits}), recomputed ({quality_points}, {credits})"
+            )
+        for slot, code in enumerate(self._semesters):
+            if (semester_qp[slot], semester_credits[slot]) != (self._semester_qp[slot], self._semester_credits[slot]):
+                raise RuntimeError(
+                    f"Cached totals for student {self.id}, semester {self._semester_names[code]!r} out of sync"
+                )
 
-            total_quality_points += grade_point * credit
-            total_credits += credit
+    def _recalculate(self) -> None:
+        self._quality_points, self._credits, semester_qp, semester_credits = self._compute_totals()
+        self._semester_qp = array('q', semester_qp)
+        self._semester_credits = array('I', semester_credits)
+        self._timeline = None
+        self.update_credit_hours()
+        if self._credits == 0:
+            self.cgpa = 0.0
+        self.calculate_cgpa()
 
-        if total_credits == 0:
-            return 0.0
+    @_synchronized
+    def recalculate_totals(self) -> None:
+        old_cgpa = self.cgpa
+        self._recalculate()
+        if self.observers:
+            self._notify([], old_cgpa)
 
-        return round(total_quality_points / total_credits, 2)
+    def _get_timeline(self) -> Tuple[List[Tuple[int, int]], List[int], array, array]:
+        if self._timeline is None:
+            keys = [self._semester_keys[code] for code in self._semesters]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            prefix_qp = array('q', [0])
+            prefix_credits = array('I', [0])
+            for slot in order:
+                prefix_qp.append(prefix_qp[-1] + self._semester_qp[slot])
+                prefix_credits.append(prefix_credits[-1] + self._semester_credits[slot])
+            self._timeline = [keys[slot][:2] for slot in order], order, prefix_qp, prefix_credits
+        return self._timeline
 
-    def calculate_cgpa(self) -> float:
-        total_quality_points = 0.0
-        total_credits = 0
+    def semester_order(self) -> List[str]:
+        _, order, _, _ = self._get_timeline()
+        return [self._semester_names[self._semesters[slot]] for slot in order]
 
-        for semester in self.courses_taken:
-            for numeric_course_code, grade in self.courses_taken[semester]:
-                if numeric_course_code not in self.course_curriculum:
-                    continue
+    @classmethod
+    def _query_key(cls, semester: Union[str, SemesterKey]) -> SemesterKey:
+        if isinstance(semester, SemesterKey):
+            return semester
+        code = cls._semester_ids.get(semester)
+        if code is not None:
+            return cls._semester_keys[code]
+        return SemesterKey.parse(semester)
 
-                curriculum = self.course_curriculum[numeric_course_code]
-                credit = curriculum.credit
-                grade_point = self.GRADE_POINTS.get(grade.upper(), 0.0)
+    def cgpa_as_of(self, semester: Union[str, SemesterKey]) -> float:
+        points, _, prefix_qp, prefix_credits = self._get_timeline()
+        end = bisect_right(points, self._query_key(semester)[:2])
+        if prefix_credits[end] == 0:
+            return 0.0
+        return round(prefix_qp[end] / (prefix_credits[end] * self._QP_SCALE), 2)
+
+    def gpa_between(self, first: Union[str, SemesterKey], last: Union[str, SemesterKey]) -> Optional[float]:
+        points, _, prefix_qp, prefix_credits = self._get_timeline()
+        start = bisect_left(points, self._query_key(first)[:2])
+        end = bisect_right(points, self._query_key(last)[:2])
+        if end <= start:
+            return None
+        credits = prefix_credits[end] - prefix_credits[start]
+        if credits == 0:
+            return 0.0
+        return round((prefix_qp[end] - prefix_qp[start]) / (credits * self._QP_SCALE), 2)
+
+    def calculate_semester_gpa(self, semester: str) -> Optional[float]:
+        slot = self._semester_slot(semester)
+        if slot is None:
+            return None
 
-                total_quality_points += grade_point * credit
-                total_credits += credit
+        if self.debug:
+            self._verify_totals()
 
+        total_credits = self._semester_credits[slot]
         if total_credits == 0:
             return 0.0
 
-        self.cgpa = round(total_quality_points / total_credits, 2)
+        return round(self._semester_qp[slot] / (total_credits * self._QP_SCALE), 2)
+
+    def calculate_cgpa(self) -> float:
+        if self.debug:
+            self._verify_totals()
+
+        if self._credits == 0:
+            return 0.0
+
+        self.cgpa = round(self._quality_points / (self._credits * self._QP_SCALE), 2)
         return self.cgpa
 
     def update_credit_hours(self) -> None:
-        self.total_credit_hour_taken = sum(
-            self.course_curriculum[course].credit
-            for semester in self.courses_taken.values()
-            for course, _ in semester
-            if course in self.course_curriculum
+        self.total_credit_hour_taken = self._credits
+
+    def grade_summary(self, schemes: Optional[Sequence['GradingScheme']] = None) -> 'GradeSummary':
+        if schemes is None:
+            schemes = self.grading_schemes
+        tables = [scheme.table for scheme in schemes]
+        weight_fields = [GradingScheme.WEIGHTS.index(scheme.weight) for scheme in schemes]
+        totals = [0.0] * len(schemes)
+        weights = [0.0] * len(schemes)
+        credits = 0
+        ects_attempted = 0.0
+        ects_earned = 0.0
+        failing = self._FAILING_CODES
+
+        for numeric_course_code, grade_code in zip(self._course_codes, self._grade_codes):
+            curriculum = self.course_curriculum.get(numeric_course_code)
+            if curriculum is None:
+                continue
+            course_weights = (curriculum.credit, curriculum.ects)
+            credits += curriculum.credit
+            ects_attempted += curriculum.ects
+            if grade_code not in failing:
+                ects_earned += curriculum.ects
+            for idx, table in enumerate(tables):
+                weight = course_weights[weight_fields[idx]]
+                totals[idx] += table[grade_code] * weight
+                weights[idx] += weight
+
+        return GradeSummary(
+            credits=credits,
+            ects_attempted=round(ects_attempted, 2),
+            ects_earned=round(ects_earned, 2),
+            averages={scheme.name: round(total / weight, 2) if weight else 0.0
+                      for scheme, total, weight in zip(schemes, totals, weights)},
         )
 
 
+class GradingScheme:
+    WEIGHTS = ('credit', 'ects')
+
+    __slots__ = ('name', 'points', 'weight', 'table')
+
+    def __init__(self, name: str, points: Mapping[str, float], weight: str = 'credit'):
+        if weight not in self.WEIGHTS:
+            raise ValueError(f"Invalid weight '{weight}'. Must be one of: {list(self.WEIGHTS)}")
+        missing = [grade for grade in Student.GRADES if grade not in points]
+        if missing:
+            raise ValueError(f"Grading scheme '{name}' has no value for grades {missing}")
+        self.name = name
+        self.points = dict(points)
+        self.weight = weight
+        self.table: Tuple[float, ...] = tuple(float(points[grade]) for grade in Student.GRADES)
+
+    def __repr__(self) -> str:
+        return f"GradingScheme(name={self.name!r}, weight={self.weight!r})"
+
+
+class GradeSummary(NamedTuple):
+    credits: int
+    ects_attempted: float
+    ects_earned: float
+    averages: Dict[str, float]
+
+
+Student._GRADE_POINT_UNITS = tuple(round(points * Student._QP_SCALE) for points in Student.GRADE_POINTS.values())
+Student.grading_schemes = (
+    GradingScheme('gpa', Student.GRADE_POINTS, 'credit'),
+    GradingScheme('ects_average', Student.GRADE_POINTS, 'ects'),
+)
+
+
+class LazyStudents(Mapping[int, Student]):
+    def __init__(self, file_path: str, student_class: type = Student, max_cached: int = 1024,
+                 report: Optional[LoadReport] = None):
+        self.file_path = file_path
+        self.student_class = student_class
+        self.max_cached = max_cached
+        self.report = report or LoadReport(file_path)
+        self._cache: 'OrderedDict[int, Tuple[Student, tuple]]' = OrderedDict()
+        self._pinned: Dict[int, Student] = {}
+        self._ids = array('q')
+        self._offsets = array('Q')
+        self._count = 0
+        self._lock = threading.Lock()
+        self._file = open(file_path, 'rb')
+        try:
+            self._scan()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _scan(self) -> None:
+        header = next(csv.reader([self._file.readline().decode('utf-8')]), [])
+        schema = self.student_class.CSV_SCHEMA
+        try:
+            indexes = resolve_columns(header, [name for name, _ in schema])
+        except KeyError as e:
+            self.report.add_error(1, f"Missing column {e} in header {header}")
+            return
+        self._parse = parse = compile_row_parser(indexes, [convert for _, convert in schema])
+
+        start = self._file.tell()
+        if start == self._file.seek(0, 2):
+            return
+        ids, offsets = self._ids, self._offsets
+        with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            mm.seek(start)
+            line_number = 1
+            offset = start
+            for line in iter(mm.readline, b''):
+                line_number += 1
+                if line.strip():
+                    self.report.rows_read += 1
+                    try:
+                        ids.append(parse(next(csv.reader([line.decode('utf-8')])))[0])
+                        offsets.append(offset)
+                    except (IndexError, ValueError) as e:
+                        self.report.add_error(line_number, f"Error processing row {line!r}: {e}")
+                offset += len(line)
+
+        ordered = all(map(int.__le__, ids, ids[1:]))
+        if not ordered:
+            order = sorted(range(len(ids)), key=ids.__getitem__)
+            self._ids = array('q', (ids[n] for n in order))
+            self._offsets = array('Q', (offsets[n] for n in order))
+        self._count = len(self._ids) - sum(map(int.__eq__, self._ids, self._ids[1:]))
+        self.report.rows_loaded = len(self._ids)
+
+    def _offset(self, student_id: int) -> Optional[int]:
+        idx = bisect_right(self._ids, student_id) - 1
+        if idx < 0 or self._ids[idx] != student_id:
+            return None
+        return self._offsets[idx]
+
+    def __getitem__(self, student_id: int) -> Student:
+        offset = self._offset(student_id)
+        if offset is None:
+            raise KeyError(student_id)
+
+        with self._lock:
+            student = self._pinned.get(student_id)
+            if student is not None:
+                return student
+            entry = self._cache.get(student_id)
+            if entry is not None:
+                self._cache.move_to_end(student_id)
+                return entry[0]
+
+            self._file.seek(offset)
+            line = self._file.readline()
+            values = self._parse(next(csv.reader([line.decode('utf-8')])))
+            student = self.student_class(*values)
+            self._cache[student_id] = student, values
+            if len(self._cache) > self.max_cached:
+                evicted_id, (evicted, evicted_values) = self._cache.popitem(last=False)
+                # Reparsing would drop changes, so changed students stay pinned.
+                if self._changed(evicted, evicted_values):
+                    self._pinned[evicted_id] = evicted
+            return student
+
+    def _changed(self, student: Student, values: tuple) -> bool:
+        fields = tuple(getattr(student, name) for name, _ in self.student_class.CSV_SCHEMA)
+        return fields != values or len(student._course_codes) > 0
+
+    def __contains__(self, student_id: object) -> bool:
+        return isinstance(student_id, int) and self._offset(student_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        previous = None
+        for student_id in self._ids:
+            if student_id != previous:
+                yield student_id
+            previous = student_id
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def cached(self) -> int:
+        return len(self._cache)
+
+    @property
+    def pinned(self) -> int:
+        return len(self._pinned)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'LazyStudents':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 class Department:
     department_details: Dict[int, 'Department'] = {}
 
+    __slots__ = ('dept_id', 'dept_name')
+
+    CSV_SCHEMA: Schema = (('dept_id', int), ('dept_name', str.strip))
+    load_report: Optional[LoadReport] = None
+
     def __init__(self, dept_id: int, dept_name: str):
         self.dept_id = dept_id
         self.dept_name = dept_name
 
     @classmethod
-    def from_csv(cls, file_path: str) -> Dict[int, 'Department']:
-        try:
-            with open(file_path, newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    try:
-                        department = cls(
-                            dept_id=int(row['dept_id']),
-                            dept_name=row['dept_name']
-                        )
-                        cls.department_details[department.dept_id] = department
-                    except (KeyError, ValueError) as e:
-                        print(f"Error processing row {row}: {e}")
-        except FileNotFoundError:
-            print(f"File not found: {file_path}")
-        return cls.department_details
+    def from_csv(cls, file_path: str, report: Optional[LoadReport] = None) -> Dict[int, 'Department']:
+        cls.load_report = report = report or LoadReport(file_path)
+        department_details = dict(cls.department_details)
+        for _, (dept_id, dept_name) in read_csv_rows(file_path, cls.CSV_SCHEMA, report):
+            department_details[dept_id] = cls(dept_id, dept_name)
+            report.rows_loaded += 1
+        cls.department_details = department_details
+        return department_details
 
 
 class Course:
     course_details: Dict[int, 'Course'] = {}
 
+    __slots__ = ('numeric_course_code', 'course_code', 'course_name')
+
+    CSV_SCHEMA: Schema = (('numeric_course_code', int), ('course_code', str.strip), ('course_name', str.strip))
+    load_report: Optional[LoadReport] = None
+
     def __init__(self, numeric_course_code: int, course_code: str, course_name: str):
         self.numeric_course_code = numeric_course_code
         self.course_code = course_code
         self.course_name = course_name
 
     @classmethod
-    def from_csv(cls, file_path: str) -> Dict[int, 'Course']:
-        try:
-            with open(file_path, newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    try:
-                        course = cls(
-                            numeric_course_code=int(row['numeric_course_code']),
-                            course_code=row['course_code'],
-                            course_name=row['course_name']
-                        )
-                        cls.course_details[course.numeric_course_code] = course
-                    except (KeyError, ValueError) as e:
-                        print(f"Error processing row {row}: {e}")
-        except FileNotFoundError:
-            print(f"File not found: {file_path}")
-        return cls.course_details
+    def from_csv(cls, file_path: str, report: Optional[LoadReport] = None) -> Dict[int, 'Course']:
+        cls.load_report = report = report or LoadReport(file_path)
+        course_details = dict(cls.course_details)
+        for _, (numeric_course_code, course_code, course_name) in read_csv_rows(file_path, cls.CSV_SCHEMA, report):
+            course_details[numeric_course_code] = cls(numeric_course_code, course_code, course_name)
+            report.rows_loaded += 1
+        cls.course_details = course_details
+        return course_details
+
+
+class CourseEnrollmentIndex(StudentObserver):
+    def __init__(self):
+        self.enrollments: Dict[int, Dict[int, int]] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def build(cls, students: Optional[Iterable[Student]] = None, attach: bool = True) -> 'CourseEnrollmentIndex':
+        index = cls()
+        if students is None:
+            students = Student.student_details.values()
+        for student in students:
+            index.add_student(student)
+        if attach:
+            index.attach()
+        return index
+
+    def _adjust(self, numeric_course_code: int, student_id: int, delta: int) -> None:
+        students = self.enrollments.setdefault(numeric_course_code, {})
+        count = students.get(student_id, 0) + delta
+        if count > 0:
+            students[student_id] = count
+        else:
+            students.pop(student_id, None)
+            if not students:
+                del self.enrollments[numeric_course_code]
+
+    def add_student(self, student: Student) -> None:
+        with self._lock:
+            for numeric_course_code in student._course_codes:
+                self._adjust(numeric_course_code, student.id, 1)
+
+    def student_updated(self, student: Student, changes: List[GradeChange], old_cgpa: float) -> None:
+        with self._lock:
+            for _, numeric_course_code, old_grade, new_grade in changes:
+                if old_grade is None and new_grade is not None:
+                    self._adjust(numeric_course_code, student.id, 1)
+                elif new_grade is None and old_grade is not None:
+                    self._adjust(numeric_course_code, student.id, -1)
+
+    def students_for(self, numeric_course_codes: Iterable[int]) -> List[int]:
+        student_ids = set()
+        with self._lock:
+            for numeric_course_code in numeric_course_codes:
+                student_ids.update(self.enrollments.get(numeric_course_code, ()))
+        return sorted(student_ids)
+
+
+class CurriculumDelta:
+    def __init__(self, report: LoadReport):
+        self.report = report
+        self.added: List[int] = []
+        self.removed: List[int] = []
+        self.changed: Dict[int, Dict[str, Tuple[Any, Any]]] = {}
+        self.recalculated: List[int] = []
+        self.applied = False
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return (f"CurriculumDelta(added={self.added}, removed={self.removed}, changed={self.changed}, "
+                f"recalculated={len(self.recalculated)}, applied={self.applied})")
+
+
+class PublishedCatalog(NamedTuple):
+    source: Optional[Dict[int, 'Curriculum']]
+    catalog: Mapping[int, 'Curriculum']
+    graph: PrerequisiteGraph
+    version: int
 
 
 class Curriculum:
     Curriculum_details: Dict[int, 'Curriculum'] = {}
+    version: int = 0
+    _published: PublishedCatalog = PublishedCatalog(None, _EMPTY_CATALOG, PrerequisiteGraph({}), 0)
+    _publish_lock = threading.Lock()
+
+    CSV_SCHEMA: Schema = (
+        ('numeric_course_code', int), ('credit', int), ('theory', int),
+        ('practical', int), ('ects', float), ('prerequisite', _code_list)
+    )
+    load_report: Optional[LoadReport] = None
+    prerequisite_graph: PrerequisiteGraph
+
+    __slots__ = ('numeric_course_code', 'credit', 'theory', 'practical', 'ects', 'prerequisite')
 
     def __init__(self, numeric_course_code: int, credit: int, theory: int, 
                  practical: int, ects: float, prerequisite: List[int]):
@@ -206,35 +1161,283 @@ class Curriculum:
         self.prerequisite = prerequisite
 
     @classmethod
-    def from_csv(cls, file_path: str) -> Dict[int, 'Curriculum']:
-        cls.Curriculum_details.clear()
+    def published(cls) -> PublishedCatalog:
+        published = cls._published
+        source = cls.Curriculum_details
+        if published.source is not source:
+            with cls._publish_lock:
+                published = cls._published
+                if published.source is not source:
+                    published = PublishedCatalog(source, MappingProxyType(source), PrerequisiteGraph(source),
+                                                 published.version + 1)
+                    cls.prerequisite_graph = published.graph
+                    cls.version = published.version
+                    cls._published = published
+        return published
+
+    @classmethod
+    def catalog(cls) -> Mapping[int, 'Curriculum']:
+        return cls.published().catalog
+
+    @classmethod
+    def _read_csv(cls, file_path: str, report: LoadReport) -> Dict[int, 'Curriculum']:
+        courses = Course.course_details
+        curriculum_details: Dict[int, 'Curriculum'] = {}
+        for line, values in read_csv_rows(file_path, cls.CSV_SCHEMA, report):
+            numeric_course_code, credit, theory, practical, ects, prerequisite = values
+            if numeric_course_code not in courses:
+                report.add_error(line, f"Course {numeric_course_code} not found")
+                continue
+            missing = [code for code in prerequisite if code not in courses]
+            if missing:
+                report.add_error(line, f"Prerequisite {missing[0]} not found")
+                continue
+            curriculum_details[numeric_course_code] = cls(
+                numeric_course_code, credit, theory, practical, ects, prerequisite
+            )
+            report.rows_loaded += 1
+        return curriculum_details
+
+    @classmethod
+    def from_csv(cls, file_path: str, report: Optional[LoadReport] = None) -> Dict[int, 'Curriculum']:
+        cls.load_report = report = report or LoadReport(file_path)
+        curriculum_details = cls._read_csv(file_path, report)
+        cls.Curriculum_details = curriculum_details
+        graph = cls.published().graph
+        if graph.cyclic:
+            report.add_error(0, f"Prerequisite cycle among courses {graph.cyclic}")
+        return curriculum_details
+
+    @classmethod
+    def reload_csv(cls, file_path: str, index: Optional[CourseEnrollmentIndex] = None,
+                   report: Optional[LoadReport] = None) -> CurriculumDelta:
+        cls.load_report = report = report or LoadReport(file_path)
+        delta = CurriculumDelta(report)
+        curriculum_details = cls._read_csv(file_path, report)
+        if not report.ok:
+            return delta
+
+        current = cls.Curriculum_details
+        for numeric_course_code, entry in curriculum_details.items():
+            previous = current.get(numeric_course_code)
+            if previous is None:
+                delta.added.append(numeric_course_code)
+                continue
+            differences = {
+                field: (getattr(previous, field), getattr(entry, field))
+                for field in cls.__slots__[1:] if getattr(previous, field) != getattr(entry, field)
+            }
+            if differences:
+                delta.changed[numeric_course_code] = differences
+            else:
+                curriculum_details[numeric_course_code] = previous
+        delta.removed = [numeric_course_code for numeric_course_code in current
+                         if numeric_course_code not in curriculum_details]
+        if delta.empty:
+            return delta
+
+        previous_version = cls.published().version
+        cls.Curriculum_details = curriculum_details
+        published = cls.published()
+        if published.graph.cyclic:
+            report.add_error(0, f"Prerequisite cycle among courses {published.graph.cyclic}")
+        delta.applied = True
+
+        if index is None:
+            index = CourseEnrollmentIndex.build(attach=False)
+        affected_codes = delta.added + delta.removed + [
+            numeric_course_code for numeric_course_code, differences in delta.changed.items()
+            if 'credit' in differences
+        ]
+        delta.recalculated = index.students_for(affected_codes)
+        affected = set(delta.recalculated)
+
+        students = Student.student_details
+        if isinstance(students, (dict, ShardedRegistry)):
+            candidates: Iterable[Student] = students.values()
+        else:
+            candidates = (students[student_id] for student_id in delta.recalculated if student_id in students)
+        for student in candidates:
+            if student.curriculum_version == published.version:
+                continue
+            stale = student.curriculum_version != previous_version
+            student.load_course_list()
+            if stale or student.id in affected:
+                student.recalculate_totals()
+        return delta
+
+
+Curriculum.published()
+
+
+class CallStats:
+    __slots__ = ('calls', 'total', 'max', 'rejected')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rejected = 0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {'calls': self.calls, 'total': self.total, 'max': self.max, 'rejected': self.rejected}
+
+
+class InstrumentationSink:
+    def record(self, name: str, elapsed: float, rejected: int) -> None:
+        pass
+
+
+class ProfileTrigger:
+    def __init__(self, output_dir: str, threshold: float, calls: int = 100,
+                 profiler_factory: Callable[[], Any] = cProfile.Profile):
+        self.output_dir = output_dir
+        self.threshold = threshold
+        self.calls = calls
+        self.profiler_factory = profiler_factory
+        self.profiles: List[str] = []
+        self._profiler: Any = None
+        self._trigger = ''
+        self._remaining = 0
+
+    def observe(self, name: str, elapsed: float) -> None:
+        if self._profiler is not None:
+            self._remaining -= 1
+            if self._remaining <= 0:
+                self.stop()
+        elif elapsed >= self.threshold:
+            self._trigger = name
+            self._remaining = self.calls
+            self._profiler = self.profiler_factory()
+            self._profiler.enable()
+
+    def stop(self) -> None:
+        if self._profiler is None:
+            return
+        profiler, self._profiler = self._profiler, None
+        profiler.disable()
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"{self._trigger}-{len(self.profiles) + 1}.prof")
+        profiler.dump_stats(path)
+        self.profiles.append(path)
+
+
+class Metrics(InstrumentationSink):
+    def __init__(self, dump_path: Optional[str] = None, dump_interval: float = 60.0,
+                 profiler: Optional[ProfileTrigger] = None):
+        self.stats: Dict[str, CallStats] = {}
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self.profiler = profiler
+        self._last_dump = time.monotonic()
+
+    def record(self, name: str, elapsed: float, rejected: int) -> None:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = CallStats()
+        stats.calls += 1
+        stats.total += elapsed
+        if elapsed > stats.max:
+            stats.max = elapsed
+        stats.rejected += rejected
+        if self.profiler is not None:
+            self.profiler.observe(name, elapsed)
+        if self.dump_path is not None and time.monotonic() - self._last_dump >= self.dump_interval:
+            self.dump()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+    def dump(self, path: Optional[str] = None) -> None:
+        path = path or self.dump_path
+        self._last_dump = time.monotonic()
+        if path is None:
+            return
+        temporary = f"{path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as output:
+            json.dump({'time': time.time(), 'stats': self.snapshot()}, output)
+        os.replace(temporary, path)
+
+    def close(self) -> None:
+        if self.profiler is not None:
+            self.profiler.stop()
+        if self.dump_path is not None:
+            self.dump()
+
+
+def _loader_rejected(cls: type, args: tuple, result: Any) -> int:
+    report = cls.load_report
+    return report.rows_read - report.rows_loaded if report is not None else 0
+
+
+def _grades_rejected(cls: type, args: tuple, result: LoadReport) -> int:
+    return result.rows_read - result.rows_loaded
+
+
+INSTRUMENTED_METHODS: Tuple[Tuple[type, str, Optional[Callable[[type, tuple, Any], int]]], ...] = (
+    (Department, 'from_csv', _loader_rejected),
+    (Course, 'from_csv', _loader_rejected),
+    (Curriculum, 'from_csv', _loader_rejected),
+    (Student, 'from_csv', _loader_rejected),
+    (Student, 'grades_from_csv', _grades_rejected),
+    (Student, 'add_course', None),
+    (Student, 'update_credit_hours', None),
+    (Student, 'calculate_cgpa', None),
+    (Student, 'calculate_semester_gpa', None),
+)
+
+_uninstrumented: Dict[Tuple[type, str], Any] = {}
+
+
+def _instrument(cls: type, name: str, func: Callable, sink: InstrumentationSink,
+                rejected: Optional[Callable[[type, tuple, Any], int]]) -> Callable:
+    label = f"{cls.__name__}.{name}"
+    clock = time.perf_counter
+    record = sink.record
+
+    def wrapper(*args, **kwargs):
+        start = clock()
         try:
-            with open(file_path, newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    try:
-                        numeric_course_code = int(row['numeric_course_code'])
-                        if numeric_course_code not in Course.course_details:
-                            raise ValueError(f"Course {numeric_course_code} not found")
-                        
-                        prerequisite = []
-                        if row['prerequisite'].strip():
-                            prerequisite = [int(code) for code in row['prerequisite'].split('|')]
-                            for code in prerequisite:
-                                if code not in Course.course_details:
-                                    raise ValueError(f"Prerequisite {code} not found")
-
-                        curriculum = cls(
-                            numeric_course_code=numeric_course_code,
-                            credit=int(row['credit']),
-                            theory=int(row['theory']),
-                            practical=int(row['practical']),
-                            ects=float(row['ects']),
-                            prerequisite=prerequisite
-                        )
-                        cls.Curriculum_details[numeric_course_code] = curriculum
-                    except (KeyError, ValueError) as e:
-                        print(f"Error processing row {row}: {e}")
-        except FileNotFoundError:
-            print(f"File not found: {file_path}")
-        return cls.Curriculum_details
\ No newline at end of file
+            result = func(*args, **kwargs)
+        except ValueError:
+            record(label, clock() - start, 1)
+            raise
+        except BaseException:
+            record(label, clock() - start, 0)
+            raise
+        record(label, clock() - start, rejected(cls, args, result) if rejected else 0)
+        return result
+
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def enable_instrumentation(sink: InstrumentationSink) -> InstrumentationSink:
+    disable_instrumentation()
+    for cls, name, rejected in INSTRUMENTED_METHODS:
+        original = cls.__dict__[name]
+        _uninstrumented[cls, name] = original
+        if isinstance(original, classmethod):
+            setattr(cls, name, classmethod(_instrument(cls, name, original.__func__, sink, rejected)))
+        else:
+            setattr(cls, name, _instrument(cls, name, original, sink, rejected))
+    return sink
+
+
+def disable_instrumentation() -> None:
+    while _uninstrumented:
+        (cls, name), original = _uninstrumented.popitem()
+        setattr(cls, name, original)
+
+
+@contextmanager
+def instrumented(sink: Optional[InstrumentationSink] = None) -> Iterator[InstrumentationSink]:
+    sink = enable_instrumentation(sink if sink is not None else Metrics())
+    try:
+        yield sink
+    finally:
+        disable_instrumentation()
+        if isinstance(sink, Metrics):
+            sink.close()
@@ -0,0 +1,107 @@
+from collections import Counter
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional
+
+from transcript import Course, Curriculum, Department, LoadReport, Student
+
+
+class ReferenceCheck:
+    def __init__(self, name: str, sample_size: int = 10):
+        self.name = name
+        self.sample_size = sample_size
+        self.keys_checked = 0
+        self.rows_checked = 0
+        self.missing_keys = 0
+        self.rows_affected = 0
+        self.samples: List[Any] = []
+
+    def compare(self, counts: Dict[Any, int], targets: Iterable[Any]) -> None:
+        missing = counts.keys() - targets
+        self.keys_checked += len(counts)
+        self.rows_checked += sum(counts.values())
+        self.missing_keys += len(missing)
+        self.rows_affected += sum(counts[key] for key in missing)
+        self.samples.extend(sorted(missing)[:self.sample_size - len(self.samples)])
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing_keys
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'keys_checked': self.keys_checked, 'rows_checked': self.rows_checked,
+                'missing_keys': self.missing_keys, 'rows_affected': self.rows_affected, 'samples': self.samples}
+
+    def __repr__(self) -> str:
+        return (f"ReferenceCheck(name={self.name!r}, missing_keys={self.missing_keys}, "
+                f"rows_affected={self.rows_affected}, samples={self.samples})")
+
+
+class IntegrityReport:
+    def __init__(self, sample_size: int = 10):
+        self.sample_size = sample_size
+        self.checks: Dict[str, ReferenceCheck] = {}
+        self.load_reports: List[LoadReport] = []
+
+    def check(self, name: str) -> ReferenceCheck:
+        check = self.checks.get(name)
+        if check is None:
+            check = self.checks[name] = ReferenceCheck(name, self.sample_size)
+        return check
+
+    @property
+    def ok(self) -> bool:
+        return all(check.ok for check in self.checks.values()) and all(report.ok for report in self.load_reports)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'ok': self.ok,
+            'checks': {name: check.as_dict() for name, check in self.checks.items()},
+            'load_reports': [{'source': report.source, 'rows_read': report.rows_read,
+                              'rows_loaded': report.rows_loaded, 'errors': len(report.errors),
+                              'samples': report.errors[:self.sample_size]}
+                             for report in self.load_reports],
+        }
+
+    def __repr__(self) -> str:
+        failing = [check for check in self.checks.values() if not check.ok]
+        return f"IntegrityReport(ok={self.ok}, failing={failing})"
+
+
+def validate_registries(students: Optional[Iterable[Student]] = None, grades_path: Optional[str] = None,
+                        chunk_size: int = 100000, sample_size: int = 10) -> IntegrityReport:
+    report = IntegrityReport(sample_size)
+    report.load_reports = [cls.load_report for cls in (Department, Course, Curriculum, Student)
+                           if cls.load_report is not None]
+    courses = Course.course_details.keys()
+    departments = Department.department_details.keys()
+    curriculum = Curriculum.Curriculum_details
+
+    report.check('curriculum.course').compare(Counter(curriculum.keys()), courses)
+    report.check('curriculum.prerequisite').compare(
+        Counter(code for entry in curriculum.values() for code in entry.prerequisite), courses
+    )
+
+    if students is None:
+        students = Student.student_details.values()
+    dept_ids: Counter = Counter()
+    enrolled: Counter = Counter()
+    for student in students:
+        dept_ids[student.dept_id] += 1
+        enrolled.update(student._course_codes)
+    report.check('student.department').compare(dept_ids, departments)
+    report.check('enrollment.course').compare(enrolled, courses)
+    report.check('enrollment.curriculum').compare(enrolled, curriculum.keys())
+
+    if grades_path is not None:
+        grades_report = LoadReport(grades_path)
+        student_ids: Counter = Counter()
+        course_codes: Counter = Counter()
+        for chunk in Student.iter_grade_records(grades_path, chunk_size, grades_report):
+            student_ids.update(map(itemgetter(1), chunk))
+            course_codes.update(map(itemgetter(3), chunk))
+        grades_report.rows_loaded = grades_report.rows_read - len(grades_report.errors)
+        report.load_reports.append(grades_report)
+        report.check('grades.student').compare(student_ids, Student.student_details.keys())
+        report.check('grades.course').compare(course_codes, courses)
+        report.check('grades.curriculum').compare(course_codes, curriculum.keys())
+    return report
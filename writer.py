@@ -0,0 +1,278 @@
+import abc
+import gzip
+import html
+import io
+import json
+import os
+import time
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from transcript import Course, Department, Student
+
+Semester = Tuple[str, List[Tuple[int, str]], float]
+
+
+def _semesters(student: Student) -> List[Semester]:
+    courses_taken = student.courses_taken
+    return [(semester, courses_taken[semester], student.calculate_semester_gpa(semester))
+            for semester in student.semester_order()]
+
+
+def _credit(student: Student, numeric_course_code: int) -> int:
+    curriculum = student.course_curriculum.get(numeric_course_code)
+    return curriculum.credit if curriculum else 0
+
+
+def _department_name(student: Student) -> str:
+    department = Department.department_details.get(student.dept_id)
+    return department.dept_name if department else str(student.dept_id)
+
+
+def _csv_field(value: Any) -> str:
+    value = str(value)
+    if any(char in value for char in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+class Layout(abc.ABC):
+    name = ''
+    extension = ''
+
+    def __init__(self):
+        self._courses: Optional[Dict[int, Course]] = None
+        self._course_cells: Dict[int, Any] = {}
+
+    def header(self) -> str:
+        return ''
+
+    def footer(self) -> str:
+        return ''
+
+    def course_cells(self, numeric_course_code: int) -> Any:
+        if self._courses is not Course.course_details:
+            self._courses = Course.course_details
+            self._course_cells = {}
+        cells = self._course_cells.get(numeric_course_code)
+        if cells is None:
+            cells = self._course_cells[numeric_course_code] = self.compile_course(
+                numeric_course_code, self._courses.get(numeric_course_code)
+            )
+        return cells
+
+    @abc.abstractmethod
+    def compile_course(self, numeric_course_code: int, course: Optional[Course]) -> Any:
+        ...
+
+    @abc.abstractmethod
+    def render(self, student: Student) -> str:
+        ...
+
+
+class TextLayout(Layout):
+    name = 'text'
+    extension = 'txt'
+
+    def compile_course(self, numeric_course_code: int, course: Optional[Course]) -> str:
+        return (f"  {course.course_code if course else numeric_course_code:<10} "
+                f"{course.course_name if course else '':<40} ")
+
+    def render(self, student: Student) -> str:
+        department = Department.department_details.get(student.dept_id)
+        parts = [f"Student ID: {student.id}\nName: {student.fullname()}\n"
+                 f"Department: {department.dept_name if department else student.dept_id}\n"]
+        for semester, courses, gpa in _semesters(student):
+            parts.append(f"\n{semester}\n")
+            for numeric_course_code, grade in courses:
+                parts.append(f"{self.course_cells(numeric_course_code)}{_credit(student, numeric_course_code):>3}"
+                             f"  {grade}\n")
+            parts.append(f"  Semester GPA: {gpa:.2f}\n")
+        parts.append(f"\nTotal Credit Hours: {student.total_credit_hour_taken}\n"
+                     f"CGPA: {student.calculate_cgpa():.2f}\n\n")
+        return ''.join(parts)
+
+
+class CsvLayout(Layout):
+    name = 'csv'
+    extension = 'csv'
+    COLUMNS = ('student_id', 'name', 'dept_id', 'semester', 'numeric_course_code', 'course_code', 'course_name',
+               'credit', 'grade', 'semester_gpa', 'cgpa')
+
+    def header(self) -> str:
+        return ','.join(self.COLUMNS) + '\n'
+
+    def compile_course(self, numeric_course_code: int, course: Optional[Course]) -> str:
+        return (f"{numeric_course_code},{_csv_field(course.course_code if course else '')},"
+                f"{_csv_field(course.course_name if course else '')}")
+
+    def render(self, student: Student) -> str:
+        prefix = f"{student.id},{_csv_field(student.fullname())},{student.dept_id},"
+        cgpa = f"{student.calculate_cgpa():.2f}"
+        parts = []
+        for semester, courses, gpa in _semesters(student):
+            semester_cells = f"{prefix}{_csv_field(semester)},"
+            for numeric_course_code, grade in courses:
+                parts.append(f"{semester_cells}{self.course_cells(numeric_course_code)},"
+                             f"{_credit(student, numeric_course_code)},{grade},{gpa:.2f},{cgpa}\n")
+        return ''.join(parts)
+
+
+class JsonLinesLayout(Layout):
+    name = 'jsonl'
+    extension = 'jsonl'
+
+    def compile_course(self, numeric_course_code: int, course: Optional[Course]) -> str:
+        return (f'{{"numeric_course_code":{numeric_course_code},'
+                f'"course_code":{json.dumps(course.course_code if course else None)},'
+                f'"course_name":{json.dumps(course.course_name if course else None)},')
+
+    def render(self, student: Student) -> str:
+        semesters = []
+        for semester, courses, gpa in _semesters(student):
+            rows = ','.join(f'{self.course_cells(numeric_course_code)}'
+                            f'"credit":{_credit(student, numeric_course_code)},"grade":"{grade}"}}'
+                            for numeric_course_code, grade in courses)
+            semesters.append(f'{{"semester":{json.dumps(semester)},"gpa":{gpa},"courses":[{rows}]}}')
+        return (f'{{"id":{student.id},"name":{json.dumps(student.fullname())},"dept_id":{student.dept_id},'
+                f'"department":{json.dumps(_department_name(student))},"semesters":[{",".join(semesters)}],'
+                f'"credit_hours":{student.total_credit_hour_taken},"cgpa":{student.calculate_cgpa()}}}\n')
+
+
+class HtmlLayout(Layout):
+    name = 'html'
+    extension = 'html'
+
+    def header(self) -> str:
+        return ('<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>Transcripts</title></head><body>\n')
+
+    def footer(self) -> str:
+        return '</body></html>\n'
+
+    def compile_course(self, numeric_course_code: int, course: Optional[Course]) -> str:
+        return (f"<tr><td>{html.escape(course.course_code) if course else numeric_course_code}</td>"
+                f"<td>{html.escape(course.course_name) if course else ''}</td>")
+
+    def render(self, student: Student) -> str:
+        parts = [f'<section class="transcript"><h2>{html.escape(student.fullname())}</h2>'
+                 f'<p>Student ID: {student.id}<br>Department: {html.escape(_department_name(student))}</p>\n']
+        for semester, courses, gpa in _semesters(student):
+            parts.append(f'<h3>{html.escape(semester)}</h3><table>'
+                         f'<tr><th>Code</th><th>Course</th><th>Credit</th><th>Grade</th></tr>\n')
+            for numeric_course_code, grade in courses:
+                parts.append(f"{self.course_cells(numeric_course_code)}"
+                             f"<td>{_credit(student, numeric_course_code)}</td><td>{grade}</td></tr>\n")
+            parts.append(f'</table><p>Semester GPA: {gpa:.2f}</p>\n')
+        parts.append(f'<p>Total Credit Hours: {student.total_credit_hour_taken}<br>'
+                     f'CGPA: {student.calculate_cgpa():.2f}</p></section>\n')
+        return ''.join(parts)
+
+
+LAYOUTS: Dict[str, Type[Layout]] = {
+    layout.name: layout for layout in (TextLayout, CsvLayout, JsonLinesLayout, HtmlLayout)
+}
+
+
+def get_layout(layout: Union[str, Layout]) -> Layout:
+    if isinstance(layout, Layout):
+        return layout
+    layout_class = LAYOUTS.get(layout)
+    if layout_class is None:
+        raise ValueError(f"Unknown layout '{layout}'. Must be one of: {list(LAYOUTS)}")
+    return layout_class()
+
+
+class WriterStats:
+    def __init__(self):
+        self.transcripts = 0
+        self.bytes = 0
+        self.compressed_bytes: Optional[int] = None
+        self.seconds = 0.0
+
+    @property
+    def transcripts_per_second(self) -> float:
+        return self.transcripts / self.seconds if self.seconds else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'transcripts': self.transcripts, 'bytes': self.bytes, 'compressed_bytes': self.compressed_bytes,
+                'seconds': self.seconds, 'transcripts_per_second': self.transcripts_per_second,
+                'bytes_per_second': self.bytes_per_second}
+
+    def __repr__(self) -> str:
+        return (f"WriterStats(transcripts={self.transcripts}, bytes={self.bytes}, "
+                f"transcripts_per_second={self.transcripts_per_second:.1f})")
+
+
+class TranscriptWriter:
+    def __init__(self, target: Union[str, IO[bytes]], layout: Union[str, Layout] = 'text',
+                 compress: Optional[bool] = None, buffer_size: int = 1 << 20, compresslevel: int = 6,
+                 encoding: str = 'utf-8'):
+        self.layout = get_layout(layout)
+        self.path = target if isinstance(target, str) else None
+        self.encoding = encoding
+        self.stats = WriterStats()
+        if compress is None:
+            compress = self.path is not None and self.path.endswith('.gz')
+
+        self._raw: IO[bytes] = open(target, 'wb', buffering=buffer_size) if self.path is not None else target
+        self._gzip: Optional[gzip.GzipFile] = None
+        self._stream: IO[bytes] = self._raw
+        if compress:
+            self._gzip = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=compresslevel)
+            self._stream = io.BufferedWriter(self._gzip, buffer_size)
+        self._started = time.perf_counter()
+        self._closed = False
+        self._write(self.layout.header())
+
+    def _write(self, text: str) -> None:
+        if text:
+            data = text.encode(self.encoding)
+            self._stream.write(data)
+            self.stats.bytes += len(data)
+
+    def write(self, student: Student) -> None:
+        self._write(self.layout.render(student))
+        self.stats.transcripts += 1
+
+    def write_rendered(self, text: str, transcripts: int) -> None:
+        self._write(text)
+        self.stats.transcripts += transcripts
+
+    def write_all(self, students: Iterable[Student]) -> WriterStats:
+        for student in students:
+            self.write(student)
+        return self.stats
+
+    def close(self) -> WriterStats:
+        if self._closed:
+            return self.stats
+        self._closed = True
+        self._write(self.layout.footer())
+        if self._gzip is not None:
+            self._stream.close()
+        else:
+            self._stream.flush()
+        if self.path is not None:
+            self._raw.close()
+            if self._gzip is not None:
+                self.stats.compressed_bytes = os.path.getsize(self.path)
+        self.stats.seconds = time.perf_counter() - self._started
+        return self.stats
+
+    def __enter__(self) -> 'TranscriptWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_transcripts(target: Union[str, IO[bytes]], students: Optional[Iterable[Student]] = None,
+                      layout: Union[str, Layout] = 'text', compress: Optional[bool] = None) -> WriterStats:
+    if students is None:
+        students = Student.student_details.values()
+    with TranscriptWriter(target, layout, compress) as writer:
+        writer.write_all(students)
+    return writer.stats